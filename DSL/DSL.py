@@ -1,15 +1,9 @@
-from typing import Any, List
-
-from dsl_parser import Parser
-
-from DSL.dsl_command import Command
-from DSL.dsl_handlers import (
-    AbstractHandler,
-    ArithmeticHandler,
-    AssignmentHandler,
-    ConversionHandler,
-    DisplayHandler,
-)
+import argparse
+import sys
+from typing import Any, List, Optional, TextIO
+
+from DSL.dsl_compiler import compile_program
+from DSL.dsl_script import ON_ERROR_CHOICES, ScriptError, ScriptSummary, run_script
 from DSL.dsl_variable import VariableStore
 
 
@@ -19,54 +13,112 @@ class DSLInterpreter:
 
     Attributes:
         store (VariableStore): The variable store used to store and retrieve variables.
-        parser (Parser): The parser used to parse DSL commands.
-        handlers (dict[str, AbstractHandler]): A dictionary of command handlers.
 
     Methods:
         execute(command_line: str) -> List[Any]: Executes the DSL commands in the given command line.
+        run_script(source: TextIO, output: TextIO, on_error: str) -> ScriptSummary: Executes a script file.
 
     """  # noqa: E501
 
     def __init__(self) -> None:
         self.store = VariableStore()
-        self.parser = Parser(self.store)
-        self.handlers: dict[str, AbstractHandler] = {
-            "assignment": AssignmentHandler(self.store, self.parser),
-            "arithmetic": ArithmeticHandler(self.store, self.parser),
-            "conversion": ConversionHandler(self.store, self.parser),
-            "display": DisplayHandler(self.store, self.parser),
-        }
 
     def execute(self, command_line: str) -> List[Any]:
         """
         Executes the DSL commands in the given command line.
 
+        The command line is compiled once and the compiled program is cached, so
+        executing the same commands again only runs the compiled instructions.
+
         Args:
             command_line (str): The command line containing DSL commands.
 
         Returns:
             List[Any]: A list of results from executing the commands.
 
+        """  # noqa: E501
+        program = compile_program(command_line)
+        return program.run(self.store, self._report_error)
+
+    def run_script(
+        self, source: TextIO, output: TextIO, on_error: str = "report"
+    ) -> ScriptSummary:
         """
-        command_statements = command_line.split(";")
-        results: List[Any] = []
-        for statement in command_statements:
-            try:
-                command = Command(statement)
-                handler: AbstractHandler = self.handlers[command.operation]  # noqa: E501
-                result = handler.handle(command)
-                if result is not None:
-                    results.append(result)
-            except ValueError as e:
-                print(f"Error in command '{statement}': {e}")
-        return results
+        Executes a script, see dsl_script.run_script, reporting errors on stderr.
+
+        Args:
+            source (TextIO): The script, statements separated by semicolons or line breaks.
+            output (TextIO): Where to write the results, one per line.
+            on_error (str): One of "fail", "report" or "skip".
+
+        Returns:
+            ScriptSummary: The number of executed and failed statements.
+        """  # noqa: E501
+        return run_script(source, output, self.store, on_error, sys.stderr)
 
+    @staticmethod
+    def _report_error(index: int, statement: str, error: Exception) -> None:
+        print(f"Error in command '{statement}': {error}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run DSL scripts, or the interactive interpreter when there is no script.
+
+    Args:
+        argv (List[str], optional): The command line arguments, sys.argv by default.
+
+    Returns:
+        int: The exit status, 1 if a statement failed.
+    """
+    parser = argparse.ArgumentParser(
+        description="Interpreter for the Roman numeral DSL."
+    )
+    parser.add_argument(
+        "scripts",
+        nargs="*",
+        help="Script files (.rdsl) to execute in order, - reads stdin.",
+    )
+    parser.add_argument(
+        "--on-error",
+        choices=ON_ERROR_CHOICES,
+        default="report",
+        help="Stop at the first failing statement, report failures on stderr (default) or skip them.",  # noqa: E501
+    )
+    args = parser.parse_args(argv)
 
-def main() -> None:
     interpreter = DSLInterpreter()
+    scripts = args.scripts
+    if not scripts:
+        if sys.stdin.isatty():
+            repl(interpreter)
+            return 0
+        scripts = ["-"]
+
+    failed = 0
+    try:
+        for script in scripts:
+            if script == "-":
+                summary = interpreter.run_script(sys.stdin, sys.stdout, args.on_error)
+            else:
+                with open(script, encoding="utf-8") as source:
+                    summary = interpreter.run_script(source, sys.stdout, args.on_error)
+            failed += summary.errors
+    except ScriptError as e:
+        print(e, file=sys.stderr)
+        return 1
+    return 1 if failed else 0
+
+
+def repl(interpreter: DSLInterpreter) -> None:
+    """Read, execute and print command lines until the input ends."""
     while True:
         try:
             command_line = input("> ")
+        except (EOFError, KeyboardInterrupt):
+            print()
+            return
+        try:
             results = interpreter.execute(command_line)
             for result in results:
                 if result is not None:
@@ -76,4 +128,4 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,343 @@
+"""Array values of the DSL.
+
+An array holds a column of numbers and, like a variable in the store, a flag that
+tells if they are Roman numerals. Arithmetic works element-wise on whole arrays,
+between two arrays of the same length or an array and a single value, and follows
+the scalar operations: the result is Roman if the left operand is, or for
+multiplication either one, Roman division rounds down and Roman results must be
+between 1 and 3999. With NumPy the numbers are NumPy arrays and the operations run
+vectorized on 64-bit integers, results that do not fit are computed on Python
+integers instead (object arrays), so they are exact like without NumPy, where the
+numbers are lists.
+Conversions and formatting go through the kernels of roman_numerals_converter.batch.
+"""  # noqa: E501
+
+import operator
+import re
+from typing import Any, Callable, Iterable, NamedTuple, Optional, Union
+
+from roman_numerals_converter import RomanNumeral, is_valid_roman
+from roman_numerals_converter.batch import HAS_NUMPY, from_roman_array, to_roman_array
+
+# Longest array written as a literal range, larger columns are loaded from files
+MAX_RANGE_LENGTH = 1_000_000
+
+# A literal range like 1..100 or I..C, both ends included
+RANGE_PATTERN = re.compile(r"([0-9]+|[MDCLXVI]+)\.\.([0-9]+|[MDCLXVI]+)")
+
+# Range of the NumPy integers arrays are computed with
+INT64_MIN = -(2**63)
+INT64_MAX = 2**63 - 1
+
+# The operands an array can be combined with
+Operand = Union["ArrayValue", RomanNumeral, int, float]
+
+
+class ArrayValue:
+    """
+    An immutable array of numbers, Roman numerals if roman is True.
+
+    Attributes:
+        numbers: The decimal values, a NumPy array when NumPy is available and a list otherwise.
+        roman (bool): Whether the numbers are Roman numerals.
+    """  # noqa: E501
+
+    __slots__ = ("numbers", "roman")
+    __hash__ = None  # type: ignore
+
+    def __init__(self, numbers: Iterable[Any], roman: bool = False) -> None:
+        self.numbers = _to_numbers(numbers)
+        self.roman = roman
+
+    def __len__(self) -> int:
+        return len(self.numbers)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ArrayValue):
+            return NotImplemented
+        return self.roman == other.roman and _as_list(self.numbers) == _as_list(
+            other.numbers
+        )
+
+    def __repr__(self) -> str:
+        return f"ArrayValue({_as_list(self.numbers)!r}, roman={self.roman})"
+
+    def __str__(self) -> str:
+        """Format the elements one per line."""
+        if self.roman:
+            return "\n".join(
+                to_roman_array(self.numbers, _uses_numpy(self.numbers)).values
+            )
+        return "\n".join(map(str, _as_list(self.numbers)))
+
+    def tolist(self) -> list[Any]:
+        """Get the elements as RomanNumeral objects or numbers."""
+        numbers = _as_list(self.numbers)
+        if self.roman:
+            return [RomanNumeral.from_decimal(number) for number in numbers]
+        return numbers
+
+    def convert(self) -> "ArrayValue":
+        """
+        Convert the elements between Roman numerals and integers, like convert.
+
+        Returns:
+            ArrayValue: The same numbers with the opposite flag.
+
+        Raises:
+            ValueError: If an element is not between 1 and 3999 or not an integer.
+        """
+        if self.roman:
+            return ArrayValue(self.numbers, roman=False)
+        _check_roman(self.numbers)
+        return ArrayValue(self.numbers, roman=True)
+
+    def __add__(self, other: Operand) -> "ArrayValue":
+        return _elementwise(operator.add, self, other)
+
+    def __radd__(self, other: Operand) -> "ArrayValue":  # type: ignore[misc]
+        return _elementwise(operator.add, other, self)
+
+    def __sub__(self, other: Operand) -> "ArrayValue":
+        return _elementwise(operator.sub, self, other)
+
+    def __rsub__(self, other: Operand) -> "ArrayValue":  # type: ignore[misc]
+        return _elementwise(operator.sub, other, self)
+
+    def __mul__(self, other: Operand) -> "ArrayValue":
+        return _elementwise(operator.mul, self, other)
+
+    def __rmul__(self, other: Operand) -> "ArrayValue":  # type: ignore[misc]
+        return _elementwise(operator.mul, other, self)
+
+    def __truediv__(self, other: Operand) -> "ArrayValue":
+        return _elementwise(operator.truediv, self, other)
+
+    def __rtruediv__(self, other: Operand) -> "ArrayValue":  # type: ignore[misc]
+        return _elementwise(operator.truediv, other, self)
+
+
+class RangeLiteral(NamedTuple):
+    """
+    A literal range, kept as its ends until it is used so that compiled programs
+    stay small.
+
+    Attributes:
+        start (int): The first number.
+        stop (int): The last number, included.
+        roman (bool): Whether the numbers are Roman numerals.
+    """
+
+    start: int
+    stop: int
+    roman: bool
+
+    def build(self) -> ArrayValue:
+        """Create the array of the numbers of the range."""
+        if HAS_NUMPY and self.stop <= INT64_MAX:
+            import numpy as np
+
+            numbers = np.arange(self.start, self.stop + 1, dtype=np.int64)
+            return ArrayValue(numbers, self.roman)
+        return ArrayValue(range(self.start, self.stop + 1), self.roman)
+
+
+def parse_range(value: str) -> Optional[RangeLiteral]:
+    """
+    Parse a literal range like 1..100 or I..C, both ends included.
+
+    Args:
+        value (str): An operand of a statement.
+
+    Returns:
+        RangeLiteral, optional: The range, None if the value is not a range.
+
+    Raises:
+        ValueError: If the ends are of different kinds or the range is longer than MAX_RANGE_LENGTH.
+    """  # noqa: E501
+    match = RANGE_PATTERN.fullmatch(value)
+    if match is None:
+        return None
+    start, stop = match.groups()
+    if start.isdigit() and stop.isdigit():
+        first, last, roman = int(start), int(stop), False
+    elif is_valid_roman(start) and is_valid_roman(stop):
+        first = RomanNumeral(start).to_decimal()
+        last, roman = RomanNumeral(stop).to_decimal(), True
+    else:
+        raise ValueError(
+            f"Invalid range '{value}' - both ends must be Roman numerals or integers"
+        )
+    if last - first + 1 > MAX_RANGE_LENGTH:
+        raise ValueError(
+            f"Invalid range '{value}' - longer than {MAX_RANGE_LENGTH} elements"
+        )
+    return RangeLiteral(first, last, roman)
+
+
+def load_array(path: str) -> ArrayValue:
+    """
+    Load an array from a text file with one value per line.
+
+    The values are Roman numerals if the first one is, integers otherwise, blank
+    lines are ignored.
+
+    Args:
+        path (str): The path of the file.
+
+    Returns:
+        ArrayValue: The values of the file.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If a value is not of the same kind as the first one.
+    """
+    with open(path, encoding="utf-8") as file:
+        lines = [line.strip() for line in file]
+    values = list(filter(None, lines))
+
+    if values and is_valid_roman(values[0]):
+        result = from_roman_array(values, HAS_NUMPY)
+        index = _first_invalid(result.valid)
+        numbers, roman = result.values, True
+    else:
+        decimal = list(map(str.isdecimal, values))
+        index = decimal.index(False) if False in decimal else None
+        numbers = list(map(int, values)) if index is None else []
+        roman = False
+
+    if index is not None:
+        # Earlier copies of the value would be invalid too, so this is its line
+        line_number = lines.index(values[index]) + 1
+        raise ValueError(
+            f"Invalid value '{values[index]}' on line {line_number} of '{path}'"
+        )
+    return ArrayValue(numbers, roman)
+
+
+def _elementwise(
+    function: Callable[[Any, Any], Any], left: Operand, right: Operand
+) -> ArrayValue:
+    """Apply an arithmetic operator to every element, see the module docstring."""
+    roman = _is_roman(left) or (function is operator.mul and _is_roman(right))
+    first, second = _numbers(left), _numbers(right)
+    if function is operator.truediv:
+        if _contains_zero(second):
+            raise ZeroDivisionError("division by zero")
+        if roman:
+            function = operator.floordiv
+
+    if _is_array(first) and _is_array(second) and len(first) != len(second):
+        raise ValueError(
+            f"Arrays must have the same length, not {len(first)} and {len(second)}"
+        )
+    if _uses_numpy(first) or _uses_numpy(second):
+        import numpy as np
+
+        first, second = np.asarray(first), np.asarray(second)
+        if _overflows_int64(function, first, second):
+            # Python integers are exact where int64 would wrap around
+            first, second = first.astype(object), second.astype(object)
+        result = function(first, second)
+    elif _is_array(first) and _is_array(second):
+        result = list(map(function, first, second))
+    elif _is_array(first):
+        result = [function(number, second) for number in first]
+    else:
+        result = [function(first, number) for number in second]
+
+    if roman:
+        _check_roman(result)
+    return ArrayValue(result, roman)
+
+
+def _overflows_int64(
+    function: Callable[[Any, Any], Any], left: Any, right: Any
+) -> bool:
+    """Check if an operation on two int64 arrays can produce results beyond int64."""
+    if function not in (operator.add, operator.sub, operator.mul):
+        return False
+    if left.dtype.kind != "i" or right.dtype.kind != "i":
+        return False
+    if not left.size or not right.size:
+        return False
+    low, high = int(left.min()), int(left.max())
+    other_low, other_high = int(right.min()), int(right.max())
+    if function is operator.add:
+        results = [low + other_low, high + other_high]
+    elif function is operator.sub:
+        results = [low - other_high, high - other_low]
+    else:
+        results = [a * b for a in (low, high) for b in (other_low, other_high)]
+    return min(results) < INT64_MIN or max(results) > INT64_MAX
+
+
+def _check_roman(numbers: Any) -> None:
+    """Check with the batch kernel that all numbers can be Roman numerals."""
+    index = _first_invalid(to_roman_array(numbers, _uses_numpy(numbers)).valid)
+    if index is not None:
+        raise ValueError(
+            f"Invalid value {_as_list(numbers)[index]} at index {index} - Roman numerals must be integers between 1 and 3999"  # noqa: E501
+        )
+
+
+def _first_invalid(valid: Any) -> Optional[int]:
+    """Get the index of the first False in a validity mask, None if there is none."""
+    if isinstance(valid, list):
+        return valid.index(False) if False in valid else None
+    return None if valid.all() else int(valid.argmin())
+
+
+def _numbers(value: Operand) -> Any:
+    if isinstance(value, ArrayValue):
+        return value.numbers
+    if isinstance(value, RomanNumeral):
+        return value.to_decimal()
+    if isinstance(value, (int, float)):
+        return value
+    raise TypeError(f"Cannot combine an array with '{value}'")
+
+
+def _to_numbers(numbers: Iterable[Any]) -> Any:
+    if not HAS_NUMPY:
+        return numbers if isinstance(numbers, list) else list(numbers)
+
+    import numpy as np
+
+    array = np.asarray(numbers)
+    if array.dtype.kind in "uf" and not _uses_numpy(numbers):
+        # Integers beyond int64 would become unsigned or floats, keep them exact
+        numbers = list(numbers)
+        if any(map(_beyond_int64, numbers)):
+            return np.array(numbers, dtype=object)
+    return array if array.size else array.astype(np.int64)
+
+
+def _beyond_int64(number: Any) -> bool:
+    return isinstance(number, int) and not INT64_MIN <= number <= INT64_MAX
+
+
+def _contains_zero(numbers: Any) -> bool:
+    if _uses_numpy(numbers):
+        return bool((numbers == 0).any())
+    if isinstance(numbers, list):
+        return 0 in numbers
+    return bool(numbers == 0)
+
+
+def _is_roman(value: Operand) -> bool:
+    return isinstance(value, RomanNumeral) or (
+        isinstance(value, ArrayValue) and value.roman
+    )
+
+
+def _is_array(numbers: Any) -> bool:
+    return isinstance(numbers, list) or _uses_numpy(numbers)
+
+
+def _uses_numpy(numbers: Any) -> bool:
+    return hasattr(numbers, "ndim")
+
+
+def _as_list(numbers: Any) -> list[Any]:
+    return numbers.tolist() if _uses_numpy(numbers) else list(numbers)
@@ -0,0 +1,417 @@
+import operator
+from functools import lru_cache
+from typing import Any, Callable, NamedTuple, Optional
+
+from DSL.dsl_array import ArrayValue, load_array, parse_range
+from DSL.dsl_command import CommandError
+from DSL.dsl_handlers import HandlerError
+from DSL.dsl_variable import DEFINED, SYMBOLS, VariableStore
+from roman_numerals_converter import RomanError, RomanNumeral, is_valid_roman
+
+# Opcodes of the intermediate representation
+SET = 0
+ADD = 1
+SUBTRACT = 2
+MULTIPLY = 3
+DIVIDE = 4
+CONVERT = 5
+DISPLAY = 6
+FAIL = 7
+# Produces a value computed at compile time, has no surface syntax
+CONSTANT = 8
+LOAD = 9
+
+OPCODES: dict[str, int] = {
+    "set": SET,
+    "add": ADD,
+    "subtract": SUBTRACT,
+    "multiply": MULTIPLY,
+    "divide": DIVIDE,
+    "convert": CONVERT,
+    "display": DISPLAY,
+    "load": LOAD,
+}
+
+ARITHMETIC: dict[int, Callable[[Any, Any], Any]] = {
+    ADD: operator.add,
+    SUBTRACT: operator.sub,
+    MULTIPLY: operator.mul,
+    DIVIDE: operator.truediv,
+}
+
+# Exceptions raised by a failing statement
+STATEMENT_ERRORS = (
+    OSError,
+    ValueError,
+    TypeError,
+    ArithmeticError,
+    AssertionError,
+    RomanError,
+    CommandError,
+    HandlerError,
+)
+
+# Number of compiled programs kept by compile_program
+COMPILE_CACHE_SIZE = 256
+
+# Number of compiled statements kept by compile_statement
+STATEMENT_CACHE_SIZE = 4096
+
+# An operand is a constant value or the slot of a variable, loaded at run time
+Operand = tuple[int, Any]
+NO_OPERAND: Operand = (False, None)
+
+# Marks an operand holding a RangeLiteral, which is built into an array at run
+# time so that cached programs do not keep the arrays alive
+RANGE = 2
+
+
+class Instruction(NamedTuple):
+    """
+    A single statement in the intermediate representation.
+
+    Attributes:
+        opcode (int): What the instruction does, e.g. ADD.
+        first (Operand): The first operand as an (is_variable, value or slot) pair, is_variable is RANGE for range literals.
+        second (Operand): The second operand, NO_OPERAND if unused.
+        target (int, optional): The slot of the variable that receives the result, None to return it.
+        statement (str): The source of the statement, used in error messages.
+    """  # noqa: E501
+
+    opcode: int
+    first: Operand
+    second: Operand
+    target: Optional[int]
+    statement: str
+
+
+class Program:
+    """
+    A compiled DSL program.
+
+    Literals are parsed, operations resolved and variable names turned into
+    slots of SYMBOLS once when the program is compiled, so running it only
+    indexes the value arrays of the store and dispatches on the opcodes. Programs are immutable and can be run many times against
+    different variable stores.
+
+    Attributes:
+        instructions (tuple[Instruction, ...]): The instructions, in order.
+        positions (tuple[int, ...]): The position of the statement of each instruction in the source, which differs from the index once instructions were removed by optimize_program.
+        size (int): One more than the highest slot the program uses, what it reserves in a store.
+    """  # noqa: E501
+
+    __slots__ = ("instructions", "positions", "size")
+
+    def __init__(
+        self,
+        instructions: tuple[Instruction, ...],
+        positions: Optional[tuple[int, ...]] = None,
+    ) -> None:
+        self.instructions = instructions
+        self.positions = (
+            positions if positions is not None else tuple(range(len(instructions)))
+        )
+        slots = [-1]
+        for _, first, second, target, _ in instructions:
+            if target is not None:
+                slots.append(target)
+            for is_variable, value in (first, second):
+                if is_variable and is_variable != RANGE:
+                    slots.append(value)
+        self.size = max(slots) + 1
+
+    def __len__(self) -> int:
+        return len(self.instructions)
+
+    def run(
+        self,
+        store: VariableStore,
+        on_error: Optional[Callable[[int, str, Exception], None]] = None,
+        results: Optional[list[Any]] = None,
+    ) -> list[Any]:
+        """
+        Run the program.
+
+        Args:
+            store (VariableStore): The variables read and written by the program.
+            on_error (Callable, optional): Called with the position of the statement, the statement and the exception when a statement fails, the program then continues. By default the exception is raised.
+            results (list, optional): The list the results are appended to, a new one by default.
+
+        Returns:
+            list[Any]: The results of the statements that return a value.
+        """  # noqa: E501
+        if results is None:
+            results = []
+        store.reserve(self.size)
+        positions = self.positions
+        for index, instruction in enumerate(self.instructions):
+            opcode, first, second, target, statement = instruction
+            try:
+                if opcode == FAIL:
+                    raise CommandError(first[1])
+
+                is_variable, value = first
+                if is_variable:
+                    if is_variable == RANGE:
+                        value = value.build()
+                    else:
+                        value = _load(store, value)
+
+                if opcode in ARITHMETIC:
+                    is_variable, other = second
+                    if is_variable:
+                        if is_variable == RANGE:
+                            other = other.build()
+                        else:
+                            other = _load(store, other)
+                    value = ARITHMETIC[opcode](value, other)
+                elif opcode == CONVERT:
+                    value = _convert(value)
+                elif opcode == DISPLAY:
+                    value = str(value)
+                elif opcode == LOAD:
+                    value = load_array(value)
+
+                if target is not None:
+                    store.assign(target, value)
+                else:
+                    results.append(value)
+            except STATEMENT_ERRORS as e:
+                if on_error is None:
+                    raise
+                on_error(positions[index], statement, e)
+        return results
+
+
+@lru_cache(maxsize=COMPILE_CACHE_SIZE)
+def compile_program(source: str, optimize: bool = True) -> Program:
+    """
+    Compile DSL source code, statements separated by semicolons.
+
+    Compiled programs are cached by their source text. Invalid statements do not
+    stop the compilation, they compile to an instruction that fails when it is
+    run, so errors are reported in the order of the statements.
+
+    Args:
+        source (str): The DSL source code.
+        optimize (bool): Whether to run optimize_program on the compiled program.
+
+    Returns:
+        Program: The compiled program.
+    """
+    instructions = []
+    for statement in source.split(";"):
+        statement = statement.strip()
+        if statement:
+            instructions.append(compile_statement(statement))
+    program = Program(tuple(instructions))
+    return optimize_program(program) if optimize else program
+
+
+@lru_cache(maxsize=STATEMENT_CACHE_SIZE)
+def compile_statement(statement: str) -> Instruction:
+    """
+    Compile a single DSL statement.
+
+    Args:
+        statement (str): The statement without the separating semicolon.
+
+    Returns:
+        Instruction: The compiled statement, a FAIL instruction if it is invalid.
+    """
+    # Same checks as Command, without building one
+    parts = statement.split()
+    if len(parts) < 2:
+        message = "Invalid command - must have at least 2 parts"
+        return Instruction(FAIL, (False, message), NO_OPERAND, None, statement)
+    op, args = parts[0], parts[1:]
+    opcode = OPCODES.get(op)
+    if opcode is None:
+        message = "Invalid command - unknown operation"
+        return Instruction(FAIL, (False, message), NO_OPERAND, None, statement)
+    try:
+        return _compile_arguments(opcode, op, args, statement)
+    except ValueError as e:
+        return _fail(op, str(e), statement)
+
+
+def _compile_arguments(
+    opcode: int, op: str, args: list[str], statement: str
+) -> Instruction:
+    """Compile the arguments of a statement, see compile_statement."""
+    if opcode in (SET, LOAD):
+        if len(args) == 3 and args[1] == "=":
+            args = [args[0], args[2]]
+        if len(args) != 2:
+            return _fail(op, "Invalid number of arguments", statement)
+        slot = SYMBOLS.slot(args[0])
+        if not SYMBOLS.valid[slot]:
+            return _fail(
+                op,
+                f"Invalid variable name '{args[0]}' - cannot be a Roman numeral",
+                statement,
+            )
+        # The file name of load is used as it is, not parsed as a value
+        first = compile_operand(args[1]) if opcode == SET else (False, args[1])
+        return Instruction(opcode, first, NO_OPERAND, slot, statement)
+
+    if opcode in ARITHMETIC:
+        if not 2 <= len(args) <= 3:
+            return _fail(op, "Invalid number of arguments", statement)
+        # Operands first, an invalid range then fails before the target is added
+        first, second = compile_operand(args[0]), compile_operand(args[1])
+        target = SYMBOLS.slot(args[2]) if len(args) == 3 else None
+        return Instruction(opcode, first, second, target, statement)
+
+    if len(args) != 1:
+        return _fail(op, "Invalid number of arguments", statement)
+    return Instruction(opcode, compile_operand(args[0]), NO_OPERAND, None, statement)
+
+
+def optimize_program(program: Program) -> Program:
+    """
+    Fold constant expressions and remove dead stores.
+
+    Arithmetic, convert and display on literals are evaluated once here instead
+    of on every run, unless they fail, which is left to the run so the error is
+    reported in order. Ranges are not folded, the program would keep their
+    arrays. Constant assignments are removed when the variable is assigned a
+    constant again before it is read, unless that would change the order in which
+    variables are defined. The optimized program produces the same results, errors
+    and variables, in the same order, as the original, also when it stops at an
+    error.
+
+    Optimizing costs about as much as running the program once, so it pays off
+    for programs that are run repeatedly, like the cached ones of compile_program.
+
+    Args:
+        program (Program): A compiled program.
+
+    Returns:
+        Program: The optimized program.
+    """
+    instructions = [
+        fold_instruction(instruction) for instruction in program.instructions
+    ]
+
+    # Constant assignments to a variable that was assigned a constant before, so
+    # the variable is certainly defined when they run
+    assigned: set[int] = set()
+    defined = [False] * len(instructions)
+    for index, (opcode, first, _, target, _) in enumerate(instructions):
+        if opcode == SET and not first[0] and target is not None:
+            defined[index] = target in assigned
+            assigned.add(target)
+
+    # Walk backwards, collecting the variables that are certainly assigned a
+    # constant later without being read first or an instruction failing in between,
+    # with the number of kept stores after that assignment. Assigning a literal
+    # cannot fail, the names of SET targets are validated when the statement is
+    # compiled or folded.
+    overwritten: dict[int, int] = {}
+    stores = 0
+    keep = [True] * len(instructions)
+    for index in range(len(instructions) - 1, -1, -1):
+        opcode, first, _, target, _ = instructions[index]
+        if opcode == SET and not first[0] and target is not None:
+            later = overwritten.get(target)
+            # A store that may define the variable is kept if another variable is
+            # assigned before the later store, so variables are defined in order
+            if later is not None and (defined[index] or later == stores - 1):
+                keep[index] = False
+            else:
+                overwritten[target] = stores
+                stores += 1
+        elif opcode != CONSTANT:
+            # Any other instruction can fail or read a variable
+            overwritten.clear()
+
+    if all(keep):
+        return Program(tuple(instructions), program.positions)
+    kept = [index for index, flag in enumerate(keep) if flag]
+    return Program(
+        tuple(instructions[index] for index in kept),
+        tuple(program.positions[index] for index in kept),
+    )
+
+
+def fold_instruction(instruction: Instruction) -> Instruction:
+    """
+    Evaluate an instruction at compile time if all its operands are literals.
+
+    Args:
+        instruction (Instruction): A compiled instruction.
+
+    Returns:
+        Instruction: A SET or CONSTANT instruction with the result, or the
+        instruction itself if it reads a variable or fails.
+    """
+    opcode, first, second, target, statement = instruction
+    if opcode not in ARITHMETIC and opcode not in (CONVERT, DISPLAY):
+        return instruction
+    if first[0] or second[0]:
+        return instruction
+    # Storing into an invalid name fails at run time, keep the instruction for it
+    if target is not None and not SYMBOLS.valid[target]:
+        return instruction
+
+    try:
+        value = first[1]
+        if opcode in ARITHMETIC:
+            value = ARITHMETIC[opcode](value, second[1])
+        elif opcode == CONVERT:
+            value = _convert(value)
+        else:
+            value = str(value)
+    except STATEMENT_ERRORS:
+        return instruction
+
+    if target is not None:
+        return Instruction(SET, (False, value), NO_OPERAND, target, statement)
+    return Instruction(CONSTANT, (False, value), NO_OPERAND, None, statement)
+
+
+def compile_operand(value: str) -> Operand:
+    """
+    Resolve a literal once at compile time, like Parser.parse does at run time.
+
+    Args:
+        value (str): A Roman numeral, a non-negative integer, a range like 1..10 or a variable name.
+
+    Returns:
+        Operand: (False, value) for literals, (RANGE, RangeLiteral) for ranges and (True, slot) for variables.
+
+    Raises:
+        ValueError: If the value is an invalid range.
+    """  # noqa: E501
+    if is_valid_roman(value):
+        return (False, RomanNumeral(value))
+    if value.isdigit():
+        return (False, int(value))
+    literal = parse_range(value)
+    if literal is not None:
+        return (RANGE, literal)
+    return (True, SYMBOLS.slot(value))
+
+
+def _load(store: VariableStore, slot: int) -> Any:
+    """Get the value of a variable, with the error message of Parser.parse."""
+    if not store.flags[slot] & DEFINED:
+        raise ValueError(
+            f"Invalid value '{SYMBOLS.names[slot]}' - cannot be parsed - Make sure it is a valid Roman numeral, integer or variable"  # noqa: E501
+        )
+    return store.load(slot)
+
+
+def _convert(value: Any) -> Any:
+    """Convert between Roman numerals and integers, element-wise for arrays."""
+    if isinstance(value, RomanNumeral):
+        return value.to_decimal()
+    if isinstance(value, ArrayValue):
+        return value.convert()
+    return RomanNumeral.from_decimal(value)
+
+
+def _fail(op: str, message: str, statement: str) -> Instruction:
+    error = str(HandlerError(op, message))
+    return Instruction(FAIL, (False, error), NO_OPERAND, None, statement)
@@ -1,9 +1,15 @@
+"""Handlers that execute a parsed Command directly.
+
+DSLInterpreter runs command lines compiled by dsl_compiler and does not use these
+handlers. They are kept for API compatibility, for code that builds Command
+objects and executes them one by one.
+"""
+
 from abc import ABC, abstractmethod
 from typing import Any, Union
 
-from dsl_parser import Parser
-
 from DSL.dsl_command import Command
+from DSL.dsl_parser import Parser
 from DSL.dsl_variable import VariableStore
 from roman_numerals_converter import RomanNumeral
 
@@ -55,7 +61,7 @@ class ArithmeticHandler(AbstractHandler):
         if op not in ["add", "subtract", "multiply", "divide"]:
             raise ValueError("Invalid operation")
 
-        if 2 <= len(command.args) <= 3:  # add a b c  - add a and b and store in c
+        if not 2 <= len(command.args) <= 3:  # add a b c  - add a and b and store in c
             raise HandlerError(op, "Invalid number of arguments")
 
         arg1 = command.args[0]
@@ -66,18 +72,21 @@ class ArithmeticHandler(AbstractHandler):
 
         try:
             if op == "add":
-                return val1 + val2
+                result = val1 + val2
             elif op == "subtract":
-                return val1 - val2
+                result = val1 - val2
             elif op == "multiply":
-                return val1 * val2
-            elif op == "divide":
-                return val1 / val2
+                result = val1 * val2
             else:
-                raise ValueError("Unknown operation")
+                result = val1 / val2
         except TypeError as e:
             raise HandlerError(op, f"Invalid operation: {e}") from e
 
+        if len(command.args) == 3:
+            self.store.set_variable(command.args[2], result)
+            return None
+        return result
+
 
 class AssignmentHandler(AbstractHandler):
     def __init__(self, store: VariableStore, parser: Parser) -> None:
@@ -88,11 +97,14 @@ class AssignmentHandler(AbstractHandler):
         if command.op != "set":
             raise HandlerError(command.op, "Invalid operation")
 
-        if len(command.args) != 2:
+        args = command.args
+        if len(args) == 3 and args[1] == "=":  # set a = X
+            args = [args[0], args[2]]
+        if len(args) != 2:
             raise HandlerError(command.op, "Invalid number of arguments")
 
-        var_name = command.args[0]
-        value = self.parser.parse(command.args[1])
+        var_name = args[0]
+        value = self.parser.parse(args[1])
         self.store.set_variable(var_name, value)
 
 
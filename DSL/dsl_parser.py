@@ -1,8 +1,7 @@
-import re
 from typing import Union
 
 from DSL.dsl_variable import VariableStore
-from roman_numerals_converter import ROMAN_REGEX, RomanNumeral
+from roman_numerals_converter import RomanNumeral, is_valid_roman
 
 
 class Parser:
@@ -54,7 +53,7 @@ class Parser:
         Returns:
             bool: True if the value is a valid Roman numeral, False otherwise.
         """
-        return re.match(ROMAN_REGEX, value) is not None
+        return is_valid_roman(value)
 
     @staticmethod
     def is_valid_integer(value: str) -> bool:
@@ -0,0 +1,126 @@
+from typing import Any, Iterable, NamedTuple, Optional, TextIO
+
+from DSL.dsl_compiler import Instruction, Program, compile_statement
+from DSL.dsl_variable import VariableStore
+
+# How failing statements are handled: stop, report them on stderr or ignore them
+ON_ERROR_CHOICES = ("fail", "report", "skip")
+
+# Number of statements compiled and run at once
+BLOCK_SIZE = 10_000
+
+# Starts a comment that runs to the end of the line
+COMMENT = "#"
+
+
+class ScriptError(Exception):
+    """Raised when a statement of a script fails and on_error is "fail"."""
+
+    def __init__(self, line_number: int, statement: str, error: Exception) -> None:
+        self.line_number = line_number
+        self.statement = statement
+        self.error = error
+        super().__init__(f"Error on line {line_number} in '{statement}': {error}")
+
+
+class ScriptSummary(NamedTuple):
+    """
+    Counters of a script run.
+
+    Attributes:
+        statements (int): The number of statements executed.
+        errors (int): The number of statements that failed.
+    """
+
+    statements: int
+    errors: int
+
+
+def iter_statements(lines: Iterable[str]) -> Iterable[tuple[int, str]]:
+    """
+    Split DSL source into statements, reading it line by line.
+
+    Statements are separated by semicolons or line breaks, and everything from
+    a # to the end of the line is a comment.
+
+    Args:
+        lines (Iterable[str]): The lines of the script, e.g. a text file object.
+
+    Yields:
+        tuple[int, str]: The line number and the text of each statement.
+    """
+    for line_number, line in enumerate(lines, 1):
+        line = line.partition(COMMENT)[0]
+        for statement in line.split(";"):
+            statement = statement.strip()
+            if statement:
+                yield line_number, statement
+
+
+def run_script(
+    source: TextIO,
+    output: TextIO,
+    store: Optional[VariableStore] = None,
+    on_error: str = "report",
+    errors: Optional[TextIO] = None,
+    block_size: int = BLOCK_SIZE,
+) -> ScriptSummary:
+    """
+    Execute a DSL script without interaction.
+
+    The script is read incrementally and executed in blocks of statements, the
+    results of each block are written to the output at once, one per line.
+
+    Args:
+        source (TextIO): The script, e.g. an .rdsl file or stdin.
+        output (TextIO): Where to write the results.
+        store (VariableStore, optional): The variables, a new store by default.
+        on_error (str): "fail" raises ScriptError at the first failing statement, "report" writes an error line to errors and continues, "skip" continues silently.
+        errors (TextIO, optional): Where to write reported errors, required for "report".
+        block_size (int): The number of statements executed at once.
+
+    Returns:
+        ScriptSummary: The number of executed and failed statements.
+
+    Raises:
+        ScriptError: If a statement fails and on_error is "fail".
+        ValueError: If on_error is unknown.
+    """  # noqa: E501
+    if on_error not in ON_ERROR_CHOICES:
+        raise ValueError(f"Unknown error handling '{on_error}'.")
+    if on_error == "report" and errors is None:
+        raise ValueError("An errors stream is required to report errors.")
+    store = store if store is not None else VariableStore()
+
+    statements = failed = 0
+    instructions: list[Instruction] = []
+    line_numbers: list[int] = []
+
+    def handle_error(index: int, statement: str, error: Exception) -> None:
+        nonlocal failed
+        failed += 1
+        script_error = ScriptError(line_numbers[index], statement, error)
+        if on_error == "fail":
+            raise script_error from error
+        if on_error == "report":
+            errors.write(f"{script_error}\n")  # type: ignore
+
+    def run_block() -> None:
+        results: list[Any] = []
+        try:
+            Program(tuple(instructions)).run(store, handle_error, results)
+        finally:
+            # Results before a failing statement are written even if it stops the script
+            if results:
+                output.write("\n".join(map(str, results)) + "\n")
+            instructions.clear()
+            line_numbers.clear()
+
+    for line_number, statement in iter_statements(source):
+        instructions.append(compile_statement(statement))
+        line_numbers.append(line_number)
+        statements += 1
+        if len(instructions) >= block_size:
+            run_block()
+    run_block()
+    return ScriptSummary(statements, failed)
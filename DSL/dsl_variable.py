@@ -1,7 +1,14 @@
-import re
-from typing import Union
+import threading
+from typing import Any, Union
 
-from roman_numerals_converter import ROMAN_REGEX, RomanNumeral
+from roman_numerals_converter import RomanNumeral, is_valid_roman
+
+# Bits of VariableStore.flags
+DEFINED = 1
+ROMAN = 2
+
+# Most distinct variable names SYMBOLS holds, which bounds the arrays of a store
+MAX_SYMBOLS = 1_000_000
 
 
 class Variable:
@@ -28,36 +35,168 @@ class Variable:
 
     @staticmethod
     def valid_name(name: str) -> bool:
-        return re.match(ROMAN_REGEX, name) is None
+        return not is_valid_roman(name)
+
+
+class SymbolTable:
+    """
+    Assigns every variable name an integer slot.
+
+    The slots are shared by all variable stores, so compiled programs resolve a
+    name once and run against any store. Names are never removed, the table grows
+    with the number of distinct variable names compiled or assigned in the
+    process, up to MAX_SYMBOLS. After that, statements using a new name fail with
+    a ValueError while the names already in the table keep working.
+
+    Attributes:
+        slots (dict[str, int]): The slot of each name.
+        names (list[str]): The name of each slot.
+        valid (bytearray): Whether the name of each slot is a valid variable name.
+        lock (threading.Lock): Serializes adding names, looking them up needs no lock.
+    """  # noqa: E501
+
+    __slots__ = ("slots", "names", "valid", "lock")
+
+    def __init__(self) -> None:
+        self.slots: dict[str, int] = {}
+        self.names: list[str] = []
+        self.valid = bytearray()
+        self.lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def slot(self, name: str) -> int:
+        """Get the slot of a name, the name is validated when it is first seen.
+
+        Args:
+            name (str): A variable name.
+
+        Returns:
+            int: The slot of the name.
+
+        Raises:
+            ValueError: If the name is new and the table already holds MAX_SYMBOLS names.
+        """  # noqa: E501
+        slot = self.slots.get(name)
+        if slot is not None:
+            return slot
+        with self.lock:
+            slot = self.slots.get(name)
+            if slot is None:
+                if len(self.names) >= MAX_SYMBOLS:
+                    raise ValueError(
+                        f"Invalid variable name '{name}' - more than {MAX_SYMBOLS} distinct names"  # noqa: E501
+                    )
+                slot = len(self.names)
+                self.names.append(name)
+                self.valid.append(Variable.valid_name(name))
+                # Published last, so a slot found without the lock is complete
+                self.slots[name] = slot
+        return slot
+
+
+SYMBOLS = SymbolTable()
 
 
 class VariableStore:
     """A class that represents a store for variables.
 
+    The values are kept in an array indexed by the slots of SYMBOLS. Roman numerals
+    are stored as their decimal value with the ROMAN flag set, integers, the
+    floats of divisions and arrays (ArrayValue) as they are. Assigning a name checks it only when the
+    variable is first defined in the store. The arrays grow up to the highest slot
+    the store is used with, so a store takes at most about 9 bytes per name of
+    SYMBOLS, plus the values themselves.
+
+    The values are a list rather than an array("q"): a list takes the same 8 bytes
+    per slot and holds the floats, arrays and integers beyond 64 bits in place,
+    while every read and write of an array("q") converts between machine and
+    Python integers, which made running programs slower.
+
     Attributes:
-        variables (dict[str, Variable]): A dictionary that stores variables, where the key is the variable name and the value is the Variable object.
+        values (list[Any]): The value of each slot, 0 if the variable is not defined.
+        flags (bytearray): The DEFINED and ROMAN bits of each slot.
+        order (list[int]): The slots of the defined variables, in the order they were defined.
     """  # noqa: E501
 
+    __slots__ = ("values", "flags", "order")
+
     def __init__(self) -> None:
-        self.variables: dict[str, Variable] = {}
+        self.values: list[Any] = []
+        self.flags = bytearray()
+        self.order: list[int] = []
+
+    @property
+    def variables(self) -> dict[str, Variable]:
+        return {name: self.get_variable(name) for name in self.variable_names}
 
     @property
     def variable_names(self) -> list[str]:
-        return list(self.variables.keys())
+        return [SYMBOLS.names[slot] for slot in self.order]
 
     @property
     def variable_values(self) -> list[Union[RomanNumeral, int]]:
-        return [variable.value for variable in self.variables.values()]
+        return [self.load(slot) for slot in self.order]
 
     @property
     def is_empty(self) -> bool:
-        return len(self.variables) == 0
+        return len(self.order) == 0
 
     def __repr__(self) -> str:
         return "\n".join([str(variable) for variable in self.variables.values()])
 
     def __contains__(self, name: str) -> bool:
-        return name in self.variables
+        slot = SYMBOLS.slots.get(name)
+        return slot is not None and slot < len(self.flags) and bool(self.flags[slot])
+
+    def reserve(self, size: int) -> None:
+        """Make room for the slots below size, call it before load and assign.
+
+        Args:
+            size (int): One more than the highest slot that will be used.
+        """
+        missing = size - len(self.flags)
+        if missing > 0:
+            self.values.extend([0] * missing)
+            self.flags.extend(bytes(missing))
+
+    def load(self, slot: int) -> Union[RomanNumeral, int]:
+        """Get the value of a defined variable by its slot.
+
+        Args:
+            slot (int): The slot of the variable.
+
+        Returns:
+            Union[RomanNumeral, int]: The value of the variable.
+        """
+        value = self.values[slot]
+        if self.flags[slot] & ROMAN:
+            return RomanNumeral.from_decimal(value)  # type: ignore
+        return value  # type: ignore
+
+    def assign(self, slot: int, value: Union[RomanNumeral, int]) -> None:
+        """Set the value of a variable by its slot.
+
+        Args:
+            slot (int): The slot of the variable.
+            value (Union[RomanNumeral, int]): The value of the variable.
+
+        Raises:
+            ValueError: If the variable is new and its name is invalid (cannot be a Roman numeral).
+        """  # noqa: E501
+        if not self.flags[slot]:
+            if not SYMBOLS.valid[slot]:
+                raise ValueError(
+                    f"Invalid variable name '{SYMBOLS.names[slot]}' - cannot be a Roman numeral"  # noqa: E501
+                )
+            self.order.append(slot)
+        if isinstance(value, RomanNumeral):
+            self.values[slot] = value.to_decimal()
+            self.flags[slot] = DEFINED | ROMAN
+        else:
+            self.values[slot] = value
+            self.flags[slot] = DEFINED
 
     def set_variable(self, name: str, value: Union[RomanNumeral, int]) -> None:
         """Set the value of a variable.
@@ -67,13 +206,11 @@ class VariableStore:
             value (Union[RomanNumeral, int]): The value of the variable.
 
         Raises:
-            ValueError: If the variable name is invalid (cannot be a Roman numeral).
-        """
-        if not Variable.valid_name(name):
-            raise ValueError(
-                f"Invalid variable name '{name}' - cannot be a Roman numeral"
-            )
-        self.variables[name] = Variable(name, value)
+            ValueError: If the variable name is invalid (cannot be a Roman numeral) or SYMBOLS is full.
+        """  # noqa: E501
+        slot = SYMBOLS.slot(name)
+        self.reserve(slot + 1)
+        self.assign(slot, value)
 
     def get_variable(self, name: str) -> Variable:
         """Get the value of a variable.
@@ -87,6 +224,6 @@ class VariableStore:
         Raises:
             ValueError: If the variable is not found.
         """
-        if name not in self.variables:
+        if name not in self:
             raise ValueError(f"Variable '{name}' not found.")
-        return self.variables[name]
+        return Variable(name, self.load(SYMBOLS.slots[name]))
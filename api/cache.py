@@ -0,0 +1,96 @@
+"""In-process response cache for the API.
+A size-bounded LRU cache in front of the converter functions, configured with
+environment variables:
+
+    ROMAN_API_CACHE            "0" disables the cache, enabled by default
+    ROMAN_API_CACHE_SIZE       maximum number of entries per cache
+    ROMAN_API_CACHE_MAX_KEY    inputs longer than this are not cached
+    ROMAN_API_CACHE_MAX_AGE    max-age of the Cache-Control header in seconds
+"""  # noqa: E501
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Generic, TypeVar
+
+CACHE_ENABLED = os.environ.get("ROMAN_API_CACHE", "1") != "0"
+CACHE_SIZE = int(os.environ.get("ROMAN_API_CACHE_SIZE", "1024"))
+CACHE_MAX_KEY = int(os.environ.get("ROMAN_API_CACHE_MAX_KEY", "4096"))
+CACHE_MAX_AGE = int(os.environ.get("ROMAN_API_CACHE_MAX_AGE", "86400"))
+
+T = TypeVar("T")
+
+
+class LRUCache(Generic[T]):
+    """A thread-safe least recently used cache with hit, miss and eviction counters.
+
+    Attributes:
+        capacity (int): The maximum number of entries.
+        max_key_size (int): Keys longer than this bypass the cache.
+        enabled (bool): Whether values are cached at all.
+    """  # noqa: E501
+
+    def __init__(
+        self,
+        capacity: int = CACHE_SIZE,
+        max_key_size: int = CACHE_MAX_KEY,
+        enabled: bool = CACHE_ENABLED,
+    ) -> None:
+        self.capacity = capacity
+        self.max_key_size = max_key_size
+        self.enabled = enabled and capacity > 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, T] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_compute(self, key: str, compute: Callable[[str], T]) -> T:
+        """Get the cached value for a key, computing and storing it on a miss.
+        Args:
+            key (str): The input of the computation.
+            compute (Callable[[str], T]): Computes the value from the key. Exceptions are not cached.
+        Returns:
+            T: The cached or computed value.
+        """  # noqa: E501
+        if not self.enabled or len(key) > self.max_key_size:
+            return compute(key)
+
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            self.misses += 1
+
+        # Compute outside the lock, concurrent misses for one key are harmless
+        value = compute(key)
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def stats(self) -> dict[str, int]:
+        """Get the counters of the cache.
+        Returns:
+            dict[str, int]: The hits, misses, evictions, current size and capacity.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "capacity": self.capacity,
+        }
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
@@ -0,0 +1,130 @@
+"""Asynchronous logging for the API.
+Records are put on a queue by the request handlers and formatted and written by a
+background thread, so no handler I/O happens on the event loop. The pipeline is
+configured with environment variables:
+
+    ROMAN_API_LOG_LEVEL        minimum level, INFO by default
+    ROMAN_API_LOG_FORMAT       "text" (default) or "json"
+    ROMAN_API_LOG_SAMPLE_RATE  fraction of records below WARNING that are kept
+    ROMAN_API_LOG_MAX_TEXT     text payloads are truncated to this many characters
+"""  # noqa: E501
+
+import json
+import logging
+import os
+import queue
+import random
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+LOG_LEVEL = os.environ.get("ROMAN_API_LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = os.environ.get("ROMAN_API_LOG_FORMAT", "text")
+LOG_SAMPLE_RATE = float(os.environ.get("ROMAN_API_LOG_SAMPLE_RATE", "1.0"))
+LOG_MAX_TEXT = int(os.environ.get("ROMAN_API_LOG_MAX_TEXT", "200"))
+
+_listener: Optional[QueueListener] = None
+
+
+class Truncated:
+    """Lazily truncated text for log arguments.
+
+    The text is only shortened when the record is actually formatted, which
+    happens in the listener thread and not at all for dropped records.
+    """
+
+    __slots__ = ("text", "max_length")
+
+    def __init__(self, text: str, max_length: int = LOG_MAX_TEXT) -> None:
+        self.text = text
+        self.max_length = max_length
+
+    def __str__(self) -> str:
+        if len(self.text) <= self.max_length:
+            return self.text
+        return f"{self.text[: self.max_length]}... ({len(self.text)} characters)"
+
+
+class SamplingFilter(logging.Filter):
+    """Keep only a fraction of the records below WARNING."""
+
+    def __init__(self, rate: float) -> None:
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno >= logging.WARNING or random.random() < self.rate
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry)
+
+
+class DeferredQueueHandler(QueueHandler):
+    """Queue records as they are, leaving the formatting to the listener thread.
+
+    QueueHandler normally formats the message before queueing it, which would
+    keep that work on the event loop.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def configure_logging(logger: logging.Logger) -> None:
+    """Send the records of a logger through the queue to a background thread.
+    Called when the app starts, undone by stop_logging when it shuts down.
+    Args:
+        logger (logging.Logger): The logger to configure, usually the package logger.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    handler = logging.StreamHandler()
+    if LOG_FORMAT == "json":
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler.setFormatter(
+            logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+        )
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    queue_handler = DeferredQueueHandler(log_queue)
+    if LOG_SAMPLE_RATE < 1.0:
+        queue_handler.addFilter(SamplingFilter(LOG_SAMPLE_RATE))
+
+    logger.addHandler(queue_handler)
+    logger.setLevel(LOG_LEVEL)
+    logger.propagate = False
+
+    _listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _listener.start()
+
+
+def stop_logging(logger: logging.Logger) -> None:
+    """Write the queued records, stop the background thread and restore the logger.
+    Args:
+        logger (logging.Logger): The logger passed to configure_logging.
+    """
+    global _listener
+    if _listener is None:
+        return
+
+    _listener.stop()
+    _listener = None
+    for handler in logger.handlers[:]:
+        if isinstance(handler, DeferredQueueHandler):
+            logger.removeHandler(handler)
+    logger.setLevel(logging.NOTSET)
+    logger.propagate = True
@@ -1,7 +1,19 @@
+import codecs
+import json
 import logging
+import os
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Optional, Union
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from pydantic import BaseModel, Field
+from starlette.types import Receive, Scope, Send
 
+from api.cache import CACHE_MAX_AGE, LRUCache
+from api.log import Truncated, configure_logging, stop_logging
+from api.metrics import REGISTRY, MetricsMiddleware
+from api.responses import FastJSONResponse, PrebuiltBody, dumps, prebuild
 from roman_numerals_converter import (
     convert_from_roman,
     convert_to_roman,
@@ -9,64 +21,333 @@ from roman_numerals_converter import (
     replace_integers_with_roman_numerals,
     replace_roman_numerals_with_integers_in_text,
 )
+from roman_numerals_converter.tables import INT_TO_ROMAN, MAX_VALUE, MIN_VALUE
 
 logger = logging.getLogger(__name__)
 
-app = FastAPI()
+# Maximum number of items accepted by the batch endpoints
+MAX_BATCH_SIZE = int(os.environ.get("ROMAN_API_MAX_BATCH_SIZE", "1000"))
 
+# Lines of the streaming endpoint longer than this are rejected
+MAX_STREAM_LINE_LENGTH = int(os.environ.get("ROMAN_API_MAX_STREAM_LINE", "4096"))
 
-@app.get("/to-roman/{number}")
-async def to_roman_endpoint(number: int):
-    logger.info(f"Converting to Roman: {number}")
+# Longest numeral produced or accepted in extended notation
+MAX_ROMAN_LENGTH = int(os.environ.get("ROMAN_API_MAX_ROMAN_LENGTH", "1000"))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # The logging thread only runs while the app is served, not on import
+    configure_logging(logging.getLogger("api"))
     try:
-        result = convert_to_roman(number)
-        logger.info(f"Result: {result}")
-        return {"result": result}
+        yield
+    finally:
+        stop_logging(logging.getLogger("api"))
+
+
+app = FastAPI(default_response_class=FastJSONResponse, lifespan=lifespan)
+app.add_middleware(MetricsMiddleware)
+
+# Caches for the endpoints whose cost grows with the input text
+replace_roman_cache: LRUCache[PrebuiltBody] = LRUCache()
+replace_integers_cache: LRUCache[PrebuiltBody] = LRUCache()
+
+# Bodies of all conversion results, serialized once at startup
+ROMAN_BODIES = {
+    number: prebuild({"result": INT_TO_ROMAN[number]})
+    for number in range(MIN_VALUE, MAX_VALUE + 1)
+}
+DECIMAL_BODIES = {
+    number: prebuild({"result": number}) for number in range(MIN_VALUE, MAX_VALUE + 1)
+}
+
+
+# The items are not typed, so one item of the wrong type gets its own error
+# instead of failing the whole batch
+class ToRomanBatchRequest(BaseModel):
+    numbers: list[Any] = Field(max_length=MAX_BATCH_SIZE)
+
+
+class FromRomanBatchRequest(BaseModel):
+    romans: list[Any] = Field(max_length=MAX_BATCH_SIZE)
+
+
+class RomanResult(BaseModel):
+    result: str
+
+
+class DecimalResult(BaseModel):
+    result: int
+
+
+class TextResult(BaseModel):
+    result: str
+
+
+class BatchItem(BaseModel):
+    result: Optional[Union[str, int]] = None
+    error: Optional[str] = None
+
+
+class BatchResponse(BaseModel):
+    results: list[BatchItem]
+
+
+class RandomRomanResult(BaseModel):
+    result: str
+    min: int
+    max: int
+    random: int
+
+
+def cacheable_response(request: Request, prebuilt: PrebuiltBody) -> Response:
+    """Build a JSON response that clients and CDNs may cache.
+
+    Conversions are deterministic, so the response carries an ETag derived
+    from its body and a Cache-Control header. A request whose If-None-Match
+    header matches the ETag gets an empty 304 response.
+    """
+    headers = {
+        "ETag": prebuilt.etag,
+        "Cache-Control": f"public, max-age={CACHE_MAX_AGE}",
+    }
+    if prebuilt.etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=headers)
+    return Response(prebuilt.body, media_type="application/json", headers=headers)
+
+
+@app.get("/to-roman/{number}", response_model=RomanResult)
+async def to_roman_endpoint(request: Request, number: int, extended: bool = False):
+    logger.info("Converting to Roman: %s", number)
+    try:
+        result = convert_to_roman(number, extended, MAX_ROMAN_LENGTH)
+        logger.info("Result: %s", result)
+        prebuilt = ROMAN_BODIES.get(number)
+        if prebuilt is None:
+            prebuilt = prebuild({"result": result})
+        return cacheable_response(request, prebuilt)
     except ValueError as e:
-        logger.error(f"Error in converting to Roman: {e}")
+        logger.error("Error in converting to Roman: %s", e)
         raise HTTPException(status_code=400, detail=str(e)) from e
 
 
-@app.get("/from-roman/{roman}")
-async def from_roman_endpoint(roman: str):
-    logger.info(f"Converting from Roman: {roman}")
+@app.get("/from-roman/{roman}", response_model=DecimalResult)
+async def from_roman_endpoint(request: Request, roman: str, extended: bool = False):
+    logger.info("Converting from Roman: %s", Truncated(roman))
     try:
-        result = convert_from_roman(roman)
-        logger.info(f"Result: {result}")
-        return {"result": result}
+        result = convert_from_roman(roman, extended, MAX_ROMAN_LENGTH)
+        logger.info("Result: %s", result)
+        prebuilt = DECIMAL_BODIES.get(result)
+        if prebuilt is None:
+            prebuilt = prebuild({"result": result})
+        return cacheable_response(request, prebuilt)
     except ValueError as e:
-        logger.error(f"Error in converting from Roman: {e}")
+        logger.error("Error in converting from Roman: %s", e)
         raise HTTPException(status_code=400, detail=str(e)) from e
 
 
-@app.get("/replace-roman")
-async def replace_roman_endpoint(text: str):
-    logger.info(f"Replacing Roman numerals in text: {text}")
-    result = replace_roman_numerals_with_integers_in_text(text)
-    logger.info(f"Result: {result}")
-    return {"result": result}
+def _json_to_roman(number: Any) -> str:
+    if isinstance(number, bool):
+        # JSON true would otherwise be converted like the integer 1
+        raise ValueError("Error converting to Roman: Number must be an integer.")
+    return convert_to_roman(number)
+
+
+@app.post("/to-roman/batch", response_model=BatchResponse)
+async def to_roman_batch_endpoint(request: ToRomanBatchRequest):
+    logger.info("Converting batch to Roman: %d numbers", len(request.numbers))
+    results: list[dict[str, Union[str, int]]] = []
+    for number in request.numbers:
+        try:
+            results.append({"result": _json_to_roman(number)})
+        except ValueError as e:
+            results.append({"error": str(e)})
+    return FastJSONResponse({"results": results})
+
+
+@app.post("/from-roman/batch", response_model=BatchResponse)
+async def from_roman_batch_endpoint(request: FromRomanBatchRequest):
+    logger.info("Converting batch from Roman: %d numerals", len(request.romans))
+    results: list[dict[str, Union[str, int]]] = []
+    for roman in request.romans:
+        try:
+            results.append({"result": convert_from_roman(roman)})
+        except ValueError as e:
+            results.append({"error": str(e)})
+    return FastJSONResponse({"results": results})
+
+
+class DuplexStreamingResponse(StreamingResponse):
+    """A StreamingResponse whose body iterator reads the request body itself.
+
+    StreamingResponse normally listens for disconnects by consuming messages
+    from receive, which would steal the request body from the iterator. A
+    disconnect is still noticed, as request.stream() raises ClientDisconnect.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+
+@app.post("/stream/convert")
+async def stream_convert_endpoint(request: Request):
+    """Convert newline-delimited values from the request body as they arrive.
+
+    Each line is a JSON value or a plain value: integers are converted to Roman
+    numerals and strings from Roman numerals. One NDJSON result is streamed
+    back per line, so memory use does not depend on the size of the body.
+    """
+    logger.info("Streaming conversion started")
+    return DuplexStreamingResponse(
+        _stream_results(_iter_lines(request.stream())),
+        media_type="application/x-ndjson",
+    )
+
+
+async def _iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Split a stream of UTF-8 bytes into lines without buffering the whole body.
+    Lines longer than MAX_STREAM_LINE_LENGTH are truncated to that length plus one
+    character, so that they are reported as invalid.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    carry = ""
+    overflow = False
+    async for chunk in chunks:
+        lines = (carry + decoder.decode(chunk)).split("\n")
+        carry = lines.pop()
+        for line in lines:
+            yield line if not overflow else ""
+            overflow = False
+        if len(carry) > MAX_STREAM_LINE_LENGTH:
+            if not overflow:
+                yield carry[: MAX_STREAM_LINE_LENGTH + 1]
+            carry = ""
+            overflow = True
+    carry += decoder.decode(b"", final=True)
+    if carry and not overflow:
+        yield carry
+
+
+async def _stream_results(lines: AsyncIterator[str]) -> AsyncIterator[bytes]:
+    async for line in lines:
+        line = line.strip()
+        if line:
+            yield dumps(_convert_stream_item(line)) + b"\n"
+
+
+def _convert_stream_item(line: str) -> dict[str, Any]:
+    if len(line) > MAX_STREAM_LINE_LENGTH:
+        return {"error": f"Line longer than {MAX_STREAM_LINE_LENGTH} characters"}
+    try:
+        value = json.loads(line)
+    except ValueError:
+        value = line
+    try:
+        if isinstance(value, int) and not isinstance(value, bool):
+            return {"result": convert_to_roman(value)}
+        if isinstance(value, str):
+            return {"result": convert_from_roman(value)}
+    except ValueError as e:
+        return {"error": str(e)}
+    return {"error": "Expected an integer or a Roman numeral"}
+
+
+# Conversions available on the WebSocket channel, by message type
+WEBSOCKET_HANDLERS: dict[str, Callable[[Any], Any]] = {
+    "to-roman": _json_to_roman,
+    "from-roman": convert_from_roman,
+    "replace-roman": replace_roman_numerals_with_integers_in_text,
+    "replace-integers": replace_integers_with_roman_numerals,
+}
+
+
+@app.websocket("/ws")
+async def websocket_endpoint(websocket: WebSocket):
+    """Answer conversion messages over one long-lived connection.
+
+    Messages are JSON objects like {"id": 1, "type": "to-roman", "value": 1994}.
+    Each one is answered in order with {"id": 1, "result": ...} or
+    {"id": 1, "error": ...}, so clients can pipeline requests.
+    """
+    await websocket.accept()
+    logger.info("WebSocket connection opened")
+    try:
+        while True:
+            message = await websocket.receive_text()
+            response = dumps(_handle_websocket_message(message))
+            await websocket.send_text(response.decode("utf-8"))
+    except WebSocketDisconnect:
+        logger.info("WebSocket connection closed")
+
+
+def _handle_websocket_message(message: str) -> dict[str, Any]:
+    try:
+        request = json.loads(message)
+    except ValueError:
+        return {"id": None, "error": "Invalid JSON"}
+    if not isinstance(request, dict):
+        return {"id": None, "error": "Expected a JSON object"}
+
+    request_id = request.get("id")
+    handler = WEBSOCKET_HANDLERS.get(request.get("type"))  # type: ignore
+    if handler is None:
+        return {"id": request_id, "error": f"Unknown type '{request.get('type')}'"}
+    try:
+        return {"id": request_id, "result": handler(request.get("value"))}
+    except (ValueError, TypeError) as e:
+        return {"id": request_id, "error": str(e)}
+
+
+@app.get("/replace-roman", response_model=TextResult)
+async def replace_roman_endpoint(request: Request, text: str):
+    logger.info("Replacing Roman numerals in text: %s", Truncated(text))
+    prebuilt = replace_roman_cache.get_or_compute(text, _build_replace_roman_body)
+    logger.info("Result: %d bytes", len(prebuilt.body))
+    return cacheable_response(request, prebuilt)
+
+
+@app.get("/replace-integers", response_model=TextResult)
+async def replace_integers_endpoint(request: Request, text: str):
+    logger.info("Replacing integers in text: %s", Truncated(text))
+    prebuilt = replace_integers_cache.get_or_compute(text, _build_replace_integers_body)
+    logger.info("Result: %d bytes", len(prebuilt.body))
+    return cacheable_response(request, prebuilt)
+
+
+def _build_replace_roman_body(text: str) -> PrebuiltBody:
+    return prebuild({"result": replace_roman_numerals_with_integers_in_text(text)})
+
+
+def _build_replace_integers_body(text: str) -> PrebuiltBody:
+    return prebuild({"result": replace_integers_with_roman_numerals(text)})
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics_endpoint():
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
 
 
-@app.get("/replace-integers")
-async def replace_integers_endpoint(text: str):
-    logger.info(f"Replacing integers in text: {text}")
-    result = replace_integers_with_roman_numerals(text)
-    logger.info(f"Result: {result}")
-    return {"result": result}
+@app.get("/cache-stats")
+async def cache_stats_endpoint():
+    return {
+        "replace-roman": replace_roman_cache.stats(),
+        "replace-integers": replace_integers_cache.stats(),
+    }
 
 
-@app.get("/random-roman/")
+@app.get("/random-roman/", response_model=RandomRomanResult)
 async def random_roman_endpoint(min_value: int = 1, max_value: int = 3999):
-    logger.info(f"Generating random Roman numeral between {min_value} and {max_value}")
+    logger.info(
+        "Generating random Roman numeral between %s and %s", min_value, max_value
+    )
     try:
         roman, random = random_roman(min_value, max_value)
-        logger.info(f"Result: {roman}, Random: {random}")
-        return {
-            "result": roman,
-            "min": min_value,
-            "max": max_value,
-            "random": random,
-        }
+        logger.info("Result: %s, Random: %s", roman, random)
+        return FastJSONResponse(
+            {"result": roman, "min": min_value, "max": max_value, "random": random}
+        )
     except ValueError as e:
-        logger.error(f"Error in generating random Roman: {e}")
+        logger.error("Error in generating random Roman: %s", e)
         raise HTTPException(status_code=400, detail=str(e)) from e
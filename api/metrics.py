@@ -0,0 +1,234 @@
+"""Request metrics for the API in the Prometheus text exposition format.
+A pure ASGI middleware records per-route request counts, error counts, latency
+and payload size histograms and the number of requests in flight. Everything is
+kept in memory and rendered on demand, no client library or network is needed.
+"""  # noqa: E501
+
+import bisect
+import time
+from typing import Iterator, Sequence
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Upper bounds of the latency buckets, in seconds
+DURATION_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# Upper bounds of the payload size buckets, in bytes
+SIZE_BUCKETS = (64, 256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+Labels = tuple[str, ...]
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = (
+        '{}="{}"'.format(
+            name, value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        )
+        for name, value in zip(names, values)
+    )
+    return "{" + ",".join(pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    # Exact for integers, :g would switch to 6 significant digits above 999999
+    return str(value) if isinstance(value, int) else repr(float(value))
+
+
+class Counter:
+    """A monotonically increasing value per label set."""
+
+    type = "counter"
+
+    def __init__(self, name: str, help: str, label_names: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.label_names = tuple(label_names)
+        self.values: dict[Labels, float] = {}
+
+    def inc(self, labels: Labels = (), amount: float = 1) -> None:
+        self.values[labels] = self.values.get(labels, 0) + amount
+
+    def samples(self) -> Iterator[str]:
+        for labels, value in self.values.items():
+            label_text = _format_labels(self.label_names, labels)
+            yield f"{self.name}{label_text} {_format_value(value)}"
+
+
+class Gauge(Counter):
+    """A value per label set that can go up and down."""
+
+    type = "gauge"
+
+    def dec(self, labels: Labels = (), amount: float = 1) -> None:
+        self.inc(labels, -amount)
+
+
+class Histogram:
+    """Counts of observations in cumulative buckets per label set."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        label_names: Sequence[str],
+        buckets: Sequence[float],
+    ) -> None:
+        self.name = name
+        self.help = help
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(buckets)
+        # Per label set: the count of each bucket (plus +Inf), the sum and the count
+        self.values: dict[Labels, tuple[list[int], list[float]]] = {}
+
+    def observe(self, labels: Labels, value: float) -> None:
+        entry = self.values.get(labels)
+        if entry is None:
+            entry = self.values[labels] = ([0] * (len(self.buckets) + 1), [0.0, 0])
+        counts, total = entry
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        total[0] += value
+        total[1] += 1
+
+    def samples(self) -> Iterator[str]:
+        bucket_names = (*self.label_names, "le")
+        bounds = [f"{bound:g}" for bound in self.buckets] + ["+Inf"]
+        for labels, (counts, (total, count)) in self.values.items():
+            cumulative = 0
+            for bound, bucket_count in zip(bounds, counts):
+                cumulative += bucket_count
+                bucket_labels = _format_labels(bucket_names, (*labels, bound))
+                yield f"{self.name}_bucket{bucket_labels} {cumulative}"
+            label_text = _format_labels(self.label_names, labels)
+            yield f"{self.name}_sum{label_text} {_format_value(total)}"
+            yield f"{self.name}_count{label_text} {_format_value(count)}"
+
+
+class MetricsRegistry:
+    """The metrics recorded for the API."""
+
+    def __init__(self) -> None:
+        self.requests = Counter(
+            "roman_api_requests_total",
+            "Total number of HTTP requests.",
+            ("route", "method", "status"),
+        )
+        self.errors = Counter(
+            "roman_api_request_errors_total",
+            "Total number of HTTP requests that failed with a server error.",
+            ("route", "method"),
+        )
+        self.in_flight = Gauge(
+            "roman_api_requests_in_flight", "Number of HTTP requests being served."
+        )
+        self.duration = Histogram(
+            "roman_api_request_duration_seconds",
+            "Latency of HTTP requests in seconds.",
+            ("route", "method"),
+            DURATION_BUCKETS,
+        )
+        self.request_size = Histogram(
+            "roman_api_request_size_bytes",
+            "Size of HTTP request bodies in bytes.",
+            ("route", "method"),
+            SIZE_BUCKETS,
+        )
+        self.response_size = Histogram(
+            "roman_api_response_size_bytes",
+            "Size of HTTP response bodies in bytes.",
+            ("route", "method"),
+            SIZE_BUCKETS,
+        )
+
+    def render(self) -> str:
+        """Render all metrics in the text exposition format.
+        Returns:
+            str: The metrics, one sample per line.
+        """
+        lines: list[str] = []
+        for metric in (
+            self.requests,
+            self.errors,
+            self.in_flight,
+            self.duration,
+            self.request_size,
+            self.response_size,
+        ):
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording the metrics of every HTTP request.
+
+    Requests are labelled with the route template, e.g. /to-roman/{number},
+    so the number of label sets stays bounded. Unmatched paths share the
+    route label "unmatched".
+    """
+
+    def __init__(self, app: ASGIApp, registry: MetricsRegistry = REGISTRY) -> None:
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        registry = self.registry
+        status = 500
+        request_size = 0
+        response_size = 0
+
+        async def counting_receive() -> Message:
+            nonlocal request_size
+            message = await receive()
+            request_size += len(message.get("body", b""))
+            return message
+
+        async def counting_send(message: Message) -> None:
+            nonlocal status, response_size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+            await send(message)
+
+        registry.in_flight.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, counting_receive, counting_send)
+        finally:
+            elapsed = time.perf_counter() - start
+            registry.in_flight.dec()
+            route = getattr(scope.get("route"), "path", "unmatched")
+            labels = (route, scope["method"])
+            registry.requests.inc((*labels, str(status)))
+            if status >= 500:
+                registry.errors.inc(labels)
+            registry.duration.observe(labels, elapsed)
+            registry.request_size.observe(labels, request_size)
+            registry.response_size.observe(labels, response_size)
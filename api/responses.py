@@ -0,0 +1,72 @@
+"""JSON responses for the API.
+Bodies are serialized with orjson when it is installed and with the standard
+library otherwise. Endpoints return these responses directly, which skips the
+jsonable_encoder pass FastAPI applies to plain return values, and the bodies of
+the fixed-shape conversion results can be built once at startup.
+"""  # noqa: E501
+
+import hashlib
+import json
+from typing import Any, NamedTuple
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is missing
+    orjson = None  # type: ignore
+
+HAS_ORJSON = orjson is not None
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize a value to compact JSON.
+    Args:
+        content (Any): A value made of dicts, lists, strings, numbers, booleans and None.
+    Returns:
+        bytes: The UTF-8 encoded JSON document.
+    """  # noqa: E501
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(content)
+        except orjson.JSONEncodeError:
+            # orjson rejects integers wider than 64 bits, e.g. extended numerals
+            pass
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """A JSONResponse serialized with orjson if available."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+class PrebuiltBody(NamedTuple):
+    """A serialized JSON body together with its ETag."""
+
+    body: bytes
+    etag: str
+
+
+def prebuild(content: Any) -> PrebuiltBody:
+    """Serialize a response body once so it can be sent many times.
+    Args:
+        content (Any): The content of the body.
+    Returns:
+        PrebuiltBody: The body and its ETag.
+    """
+    body = dumps(content)
+    return PrebuiltBody(body, etag_for(body))
+
+
+def etag_for(body: bytes) -> str:
+    """Derive a strong ETag from a response body.
+    Args:
+        body (bytes): The response body.
+    Returns:
+        str: The quoted ETag.
+    """
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
@@ -0,0 +1,53 @@
+"""Latency benchmark for the REST endpoints versus the WebSocket channel.
+Both run in-process through the FastAPI test client, so the numbers show the
+per-request framework overhead rather than network latency.
+Run with `python -m benchmarks.bench_api` from the repository root.
+"""
+
+import time
+
+from fastapi.testclient import TestClient
+
+from api.main import app
+
+
+def bench_rest(client: TestClient, number: int) -> float:
+    start = time.perf_counter()
+    for value in range(1, number + 1):
+        client.get(f"/to-roman/{value}")
+    return time.perf_counter() - start
+
+
+def bench_websocket(client: TestClient, number: int) -> float:
+    with client.websocket_connect("/ws") as websocket:
+        start = time.perf_counter()
+        for value in range(1, number + 1):
+            websocket.send_json({"id": value, "type": "to-roman", "value": value})
+            websocket.receive_json()
+        return time.perf_counter() - start
+
+
+def bench_websocket_pipelined(client: TestClient, number: int) -> float:
+    with client.websocket_connect("/ws") as websocket:
+        start = time.perf_counter()
+        for value in range(1, number + 1):
+            websocket.send_json({"id": value, "type": "to-roman", "value": value})
+        for _ in range(number):
+            websocket.receive_json()
+        return time.perf_counter() - start
+
+
+def main(number: int = 2000) -> None:
+    client = TestClient(app)
+    benchmarks = {
+        "REST GET /to-roman": bench_rest,
+        "WebSocket round trips": bench_websocket,
+        "WebSocket pipelined": bench_websocket_pipelined,
+    }
+    for name, benchmark in benchmarks.items():
+        seconds = benchmark(client, number)
+        print(f"{name:<24} {seconds / number * 1e6:8.1f} us/request")
+
+
+if __name__ == "__main__":
+    main()
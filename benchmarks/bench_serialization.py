@@ -0,0 +1,43 @@
+"""Serialization cost per response of the conversion endpoints.
+Compares the generic FastAPI path for a returned dict (jsonable_encoder and a
+stdlib JSONResponse) with the orjson response class and the prebuilt bodies.
+Run with `python -m benchmarks.bench_serialization` from the repository root.
+"""
+
+import timeit
+from typing import Callable
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
+
+from api.responses import HAS_ORJSON, FastJSONResponse, prebuild
+
+CONTENT = {"result": "MCMXCIV"}
+PREBUILT = prebuild(CONTENT)
+
+
+def generic_response() -> Response:
+    return JSONResponse(jsonable_encoder(CONTENT))
+
+
+def fast_response() -> Response:
+    return FastJSONResponse(CONTENT)
+
+
+def prebuilt_response() -> Response:
+    return Response(PREBUILT.body, media_type="application/json")
+
+
+def main(number: int = 100_000) -> None:
+    benchmarks: dict[str, Callable[[], Response]] = {
+        "jsonable_encoder + JSONResponse": generic_response,
+        f"FastJSONResponse (orjson: {HAS_ORJSON})": fast_response,
+        "Prebuilt body": prebuilt_response,
+    }
+    for name, benchmark in benchmarks.items():
+        seconds = min(timeit.repeat(benchmark, number=number, repeat=3))
+        print(f"{name:<36} {seconds / number * 1e6:8.2f} us/response")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Microbenchmark for the Roman numeral validation strategies.
+Run with `python -m benchmarks.bench_validation` from the repository root.
+"""
+
+import re
+import timeit
+
+from roman_numerals_converter.validation import (
+    ROMAN_REGEX,
+    is_valid_roman,
+    matches_roman_pattern,
+)
+
+SAMPLES = ["MCMXCIV", "XLII", "MMMCMXCIX", "I", "HELLO", "IIII", "word", "MMXXIV"]
+
+
+def uncompiled_search(value: str) -> bool:
+    """The previous strategy: re.search with the pattern string on every call."""
+    return re.search(ROMAN_REGEX, value) is not None
+
+
+def main(number: int = 100_000) -> None:
+    strategies = {
+        "re.search(ROMAN_REGEX)": uncompiled_search,
+        "ROMAN_PATTERN.fullmatch": matches_roman_pattern,
+        "frozenset membership": is_valid_roman,
+    }
+    for name, strategy in strategies.items():
+        seconds = timeit.timeit(
+            lambda strategy=strategy: [strategy(value) for value in SAMPLES],
+            number=number,
+        )
+        per_call = seconds / (number * len(SAMPLES)) * 1e9
+        print(f"{name:<26} {per_call:8.1f} ns/call")
+
+
+if __name__ == "__main__":
+    main()
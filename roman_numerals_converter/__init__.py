@@ -1,4 +1,5 @@
-from roman_numerals_converter.__main__ import cli  # noqa: F401
+from typing import TYPE_CHECKING, Any
+
 from roman_numerals_converter.converter import (
     convert_from_roman,  # noqa: F401
     convert_to_roman,  # noqa: F401
@@ -7,15 +8,27 @@ from roman_numerals_converter.converter import (
     replace_roman_numerals_with_integers_in_text,  # noqa: F401
 )
 from roman_numerals_converter.roman import (
-    ROMAN_REGEX,
     RomanError,
     RomanNumeral,
 )
+from roman_numerals_converter.validation import (
+    ROMAN_REGEX,
+    is_valid_roman,  # noqa: F401
+)
+
+if TYPE_CHECKING:
+    from roman_numerals_converter.__main__ import cli  # noqa: F401
+
+# Attributes imported on first access, so importing the package stays cheap
+_LAZY_ATTRIBUTES = {
+    "cli": "roman_numerals_converter.__main__",
+}
 
 __all__ = [
     "cli",
     "convert_from_roman",
     "convert_to_roman",
+    "is_valid_roman",
     "random_roman",
     "replace_integers_with_roman_numerals",
     "replace_roman_numerals_with_integers_in_text",
@@ -23,3 +36,15 @@ __all__ = [
     "RomanNumeral",
     "ROMAN_REGEX",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the attributes that depend on click on first access."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
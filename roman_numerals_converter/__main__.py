@@ -2,8 +2,20 @@
 This script provides a command-line interface to convert numbers to Roman numerals and vice versa.
 """  # noqa: E501
 
+import contextlib
+import signal
+import sys
+import time
+from typing import Optional, TextIO
+
 import click
 
+# Only the choices of the batch module are needed to declare the commands, the
+# daemon and parallel modules are imported by the commands using them, so simple
+# conversions do not pay for socket and multiprocessing imports
+from .batch import DIRECTIONS, ON_ERROR_CHOICES
+from .converter import convert_from_roman, convert_to_roman
+from .extended import MAX_LENGTH
 from .roman import RomanNumeral
 
 
@@ -17,17 +29,36 @@ def cli() -> None:
 
 @cli.command()
 @click.argument("number", type=int)
-def to_roman(number: int) -> None:
+@click.option(
+    "--extended", is_flag=True, help="Write numbers above 3999 in vinculum notation."
+)
+@click.option(
+    "--max-length",
+    type=click.IntRange(min=1),
+    default=MAX_LENGTH,
+    show_default=True,
+    help="Longest extended numeral, in characters.",
+)
+def to_roman(number: int, extended: bool, max_length: int) -> None:
     """
     Convert a number to a Roman numeral.
 
     Args:
         number (int): A decimal number to be converted into Roman numeral.
+        extended (bool): Whether to write numbers above 3999 in vinculum notation.
+        max_length (int): The longest extended numeral to produce.
 
     This function takes an integer and converts it into its Roman numeral representation.
     It checks if the number is within the permissible range (1-3999) and then converts it
     using defined Roman numeral mappings.
     """  # noqa: E501
+    if extended:
+        try:
+            click.echo(convert_to_roman(number, True, max_length))
+        except ValueError as e:
+            raise click.BadParameter(str(e)) from e
+        return
+
     # Check that the number is within the valid range
     if not 0 < number < 4000:
         raise click.BadParameter("Please enter a number between 1 and 3999.")
@@ -39,17 +70,34 @@ def to_roman(number: int) -> None:
 
 @cli.command()
 @click.argument("roman", type=str)
-def from_roman(roman: str) -> None:
+@click.option("--extended", is_flag=True, help="Accept numerals in vinculum notation.")
+@click.option(
+    "--max-length",
+    type=click.IntRange(min=1),
+    default=MAX_LENGTH,
+    show_default=True,
+    help="Longest extended numeral, in characters.",
+)
+def from_roman(roman: str, extended: bool, max_length: int) -> None:
     """
     Convert a Roman numeral to a number.
 
     Args:
         roman (str): A Roman numeral to be converted into a decimal number.
+        extended (bool): Whether to accept numerals in vinculum notation.
+        max_length (int): The longest extended numeral to accept.
 
     This function takes a Roman numeral and converts it into its decimal representation.
     It first validates the Roman numeral using a regular expression and then performs
     the conversion using defined mappings from Roman numerals to decimal numbers.
     """
+    if extended:
+        try:
+            click.echo(convert_from_roman(roman, True, max_length))
+        except ValueError as e:
+            raise click.BadParameter("Please enter a valid Roman numeral.") from e
+        return
+
     # Validate Roman numeral input
     if not RomanNumeral.is_valid_roman(roman):
         raise click.BadParameter("Please enter a valid Roman numeral.")
@@ -58,3 +106,193 @@ def from_roman(roman: str) -> None:
     rn = RomanNumeral(roman)
     num: int = rn.to_decimal()
     click.echo(num)
+
+
+@cli.command()
+@click.argument("input", type=click.File("r"), default="-")
+@click.argument("output", type=click.File("w"), default="-")
+@click.option(
+    "--workers",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="Number of worker processes, 0 uses one per CPU.",
+)
+def replace_roman(input: TextIO, output: TextIO, workers: int) -> None:
+    """
+    Replace Roman numerals in a text with integers.
+
+    Args:
+        input (TextIO): The text to read, stdin by default.
+        output (TextIO): Where to write the converted text, stdout by default.
+        workers (int): The number of worker processes.
+
+    The text is streamed in chunks, so inputs larger than memory can be piped through.
+    """  # noqa: E501
+    from .parallel import replace_roman_numerals_parallel
+
+    for chunk in replace_roman_numerals_parallel(input, workers or None):
+        output.write(chunk)
+
+
+@cli.command()
+@click.argument("input", type=click.File("r"), default="-")
+@click.argument("output", type=click.File("w"), default="-")
+@click.option(
+    "--workers",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="Number of worker processes, 0 uses one per CPU.",
+)
+def replace_integers(input: TextIO, output: TextIO, workers: int) -> None:
+    """
+    Replace integers in a text with Roman numerals.
+
+    Args:
+        input (TextIO): The text to read, stdin by default.
+        output (TextIO): Where to write the converted text, stdout by default.
+        workers (int): The number of worker processes.
+
+    The text is streamed in chunks, so inputs larger than memory can be piped through.
+    Integers without a Roman numeral, like 0 or 10000, are left unchanged.
+    """  # noqa: E501
+    from .parallel import replace_integers_parallel
+
+    for chunk in replace_integers_parallel(input, workers or None):
+        output.write(chunk)
+
+
+@cli.command()
+@click.argument("direction", type=click.Choice(DIRECTIONS))
+@click.argument("input", type=click.File("r"), default="-")
+@click.argument("output", type=click.File("w"), default="-")
+@click.option(
+    "--on-error",
+    type=click.Choice(ON_ERROR_CHOICES),
+    default="fail",
+    show_default=True,
+    help="Skip invalid lines, mark them in the output or stop at the first one.",
+)
+@click.option("--quiet", is_flag=True, help="Do not print the summary line.")
+@click.option(
+    "--workers",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="Number of worker processes, 0 uses one per CPU.",
+)
+def batch(
+    direction: str,
+    input: TextIO,
+    output: TextIO,
+    on_error: str,
+    quiet: bool,
+    workers: int,
+) -> None:
+    """
+    Convert newline-delimited values in bulk.
+
+    Args:
+        direction (str): Either to-roman or from-roman.
+        input (TextIO): The values to read, one per line, stdin by default.
+        output (TextIO): Where to write the results, stdout by default.
+        on_error (str): How to handle invalid lines.
+        quiet (bool): Whether to suppress the summary line.
+        workers (int): The number of worker processes.
+
+    The input is read and written in large blocks of lines, which are converted
+    in order by the worker processes. A summary with the throughput is printed
+    to stderr at the end.
+    """
+    from .batch import read_line_blocks
+    from .parallel import convert_line_blocks
+
+    start = time.perf_counter()
+    total = invalid = 0
+    blocks = read_line_blocks(input)
+    try:
+        for converted, block_invalid, block_lines in convert_line_blocks(
+            blocks, direction, on_error, workers or None
+        ):
+            if converted:
+                output.write("\n".join(converted) + "\n")
+            total += block_lines
+            invalid += block_invalid
+    except ValueError as e:
+        raise click.ClickException(str(e)) from e
+
+    if not quiet:
+        elapsed = time.perf_counter() - start
+        rate = total / elapsed if elapsed > 0 else float("inf")
+        click.echo(
+            f"Converted {total - invalid} of {total} lines ({invalid} invalid) "
+            f"in {elapsed:.3f}s, {rate:.0f} lines/s",
+            err=True,
+        )
+
+
+@cli.command()
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False),
+    help="Path of the Unix domain socket, ROMAN_NUMERALS_SOCKET or a per-user default.",  # noqa: E501
+)
+def serve(socket_path: Optional[str]) -> None:
+    """
+    Run a conversion daemon on a Unix domain socket.
+
+    Args:
+        socket_path (str, optional): The path of the socket.
+
+    The daemon answers requests of the client command until it is interrupted.
+    Scripts can also talk to it directly, one request per line, e.g.
+    `echo "to-roman 1 2 3" | socat - UNIX-CONNECT:<socket>`.
+    """
+    from .daemon import default_socket_path, make_server, run_server
+
+    socket_path = socket_path or default_socket_path()
+    try:
+        server = make_server(socket_path)
+    except RuntimeError as e:
+        raise click.ClickException(str(e)) from e
+    click.echo(f"Listening on {socket_path}", err=True)
+    # Stop cleanly on SIGTERM too, so the socket file is removed
+    signal.signal(signal.SIGTERM, lambda *args: sys.exit(0))
+    with contextlib.suppress(KeyboardInterrupt):
+        run_server(server)
+
+
+@cli.command()
+@click.argument("direction", type=click.Choice(DIRECTIONS))
+@click.argument("values", nargs=-1)
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False),
+    help="Path of the Unix domain socket, ROMAN_NUMERALS_SOCKET or a per-user default.",  # noqa: E501
+)
+def client(direction: str, values: tuple[str, ...], socket_path: Optional[str]) -> None:
+    """
+    Convert values with the daemon started by serve.
+
+    Args:
+        direction (str): Either to-roman or from-roman.
+        values (tuple[str, ...]): The values to convert, read from stdin, one per line, if none are given.
+        socket_path (str, optional): The path of the socket.
+
+    Values are sent in batches over one connection. When no daemon is running
+    they are converted in this process. One result is printed per line, invalid
+    values are marked.
+    """  # noqa: E501
+    from .daemon import iter_convert, read_value_blocks
+
+    blocks = [list(values)] if values else read_value_blocks(sys.stdin)
+    for results in iter_convert(direction, blocks, socket_path):
+        if results:
+            click.echo("\n".join(results))
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,209 @@
+"""Batch conversion of Roman numerals.
+This module converts whole columns of values at once. When NumPy is installed the
+conversions run on arrays using the precomputed lookup tables and fancy indexing,
+otherwise a pure Python fallback returns lists. Invalid elements never raise,
+they are reported in a validity mask instead.
+"""  # noqa: E501
+
+import operator
+from importlib.util import find_spec
+from typing import Any, Iterable, Iterator, NamedTuple, TextIO
+
+from .tables import INT_TO_ROMAN, MAX_VALUE, MIN_VALUE, ROMAN_TO_INT
+
+# NumPy is only imported by the vectorized functions, it is slow to import
+HAS_NUMPY = find_spec("numpy") is not None
+
+# Conversion directions for line based batches
+DIRECTIONS = ("to-roman", "from-roman")
+
+# How to treat invalid lines: leave them out, replace them by a marker or stop
+ON_ERROR_CHOICES = ("skip", "mark", "fail")
+INVALID_MARKER = "#INVALID"
+
+# Approximate number of characters read per block of lines
+BLOCK_SIZE = 1024 * 1024
+
+
+class BatchResult(NamedTuple):
+    """Result of a batch conversion.
+
+    Attributes:
+        values: The converted values, a NumPy array when NumPy is available and a list otherwise. Invalid elements hold "" or 0.
+        valid: A boolean mask of the same shape, True where the input element was valid.
+    """  # noqa: E501
+
+    values: Any
+    valid: Any
+
+
+def to_roman_array(numbers: Iterable[Any], use_numpy: bool = HAS_NUMPY) -> BatchResult:
+    """Convert many decimal numbers to Roman numerals.
+    Args:
+        numbers (Iterable): Integers, a NumPy integer array or any buffer of integers.
+        use_numpy (bool): Whether to use the vectorized NumPy implementation.
+    Returns:
+        BatchResult: The Roman numerals (object array of str) and the validity mask.
+    """  # noqa: E501
+    if not use_numpy:
+        return _to_roman_list(numbers)
+
+    import numpy as np
+
+    array = np.asarray(_materialize(numbers))
+    if array.dtype.kind == "O":
+        # Arbitrary Python objects, e.g. ints too large for a machine integer
+        result = _to_roman_list(array.ravel().tolist())
+        return BatchResult(
+            np.array(result.values, dtype=object).reshape(array.shape),
+            np.array(result.valid, dtype=bool).reshape(array.shape),
+        )
+
+    if array.dtype.kind not in "iu":
+        # Floats, strings, ... are rejected just like convert_to_roman does
+        return BatchResult(
+            np.full(array.shape, "", dtype=object),
+            np.zeros(array.shape, dtype=bool),
+        )
+
+    valid = (array >= MIN_VALUE) & (array <= MAX_VALUE)
+    indices = np.where(valid, array, 0)
+    return BatchResult(_roman_table()[indices], valid)
+
+
+def from_roman_array(romans: Iterable[Any], use_numpy: bool = HAS_NUMPY) -> BatchResult:
+    """Convert many Roman numerals to decimal numbers.
+    Args:
+        romans (Iterable): Strings or a NumPy string array.
+        use_numpy (bool): Whether to use the vectorized NumPy implementation.
+    Returns:
+        BatchResult: The decimal numbers (int64 array) and the validity mask.
+    """
+    if not use_numpy:
+        return _from_roman_list(romans)
+
+    import numpy as np
+
+    array = np.asarray(_materialize(romans))
+    if array.dtype.kind != "U":
+        result = _from_roman_list(array.ravel().tolist())
+        return BatchResult(
+            np.array(result.values, dtype=np.int64).reshape(array.shape),
+            np.array(result.valid, dtype=bool).reshape(array.shape),
+        )
+
+    # Look up each distinct spelling once and scatter the results back
+    uniques, inverse = np.unique(array, return_inverse=True)
+    lookup = np.array(
+        [ROMAN_TO_INT.get(roman, 0) for roman in uniques.tolist()], dtype=np.int64
+    )
+    values = lookup[inverse.reshape(array.shape)]
+    return BatchResult(values, values > 0)
+
+
+def convert_lines(
+    lines: Iterable[str],
+    direction: str,
+    on_error: str = "fail",
+    first_line: int = 1,
+) -> tuple[list[str], int]:
+    """Convert newline-delimited values.
+    Args:
+        lines (Iterable[str]): The values, one per line, surrounding whitespace is ignored.
+        direction (str): Either "to-roman" or "from-roman".
+        on_error (str): "skip" drops invalid lines, "mark" replaces them with INVALID_MARKER and "fail" raises.
+        first_line (int): The line number of the first line, used in error messages.
+    Returns:
+        tuple[list[str], int]: The converted lines without line endings and the number of invalid lines.
+    Raises:
+        ValueError: If a line is invalid and on_error is "fail", or if an argument is unknown.
+    """  # noqa: E501
+    if direction not in DIRECTIONS:
+        raise ValueError(f"Unknown direction '{direction}'.")
+    if on_error not in ON_ERROR_CHOICES:
+        raise ValueError(f"Unknown error handling '{on_error}'.")
+
+    to_roman = direction == "to-roman"
+    converted: list[str] = []
+    invalid = 0
+    for line_number, line in enumerate(lines, first_line):
+        value = line.strip()
+        if to_roman:
+            # Longer digit strings are out of range anyway, skip parsing them
+            number = int(value) if value.isdecimal() and len(value) < 16 else 0
+            result = INT_TO_ROMAN[number] if MIN_VALUE <= number <= MAX_VALUE else ""
+        else:
+            decimal = ROMAN_TO_INT.get(value)
+            result = str(decimal) if decimal is not None else ""
+
+        if result:
+            converted.append(result)
+            continue
+
+        invalid += 1
+        if on_error == "fail":
+            raise ValueError(f"Invalid value on line {line_number}: '{value}'")
+        if on_error == "mark":
+            converted.append(INVALID_MARKER)
+    return converted, invalid
+
+
+def read_line_blocks(file: TextIO, block_size: int = BLOCK_SIZE) -> Iterator[list[str]]:
+    """Read a text file in blocks of whole lines.
+    Args:
+        file (TextIO): The file to read.
+        block_size (int): Approximate number of characters per block.
+    Yields:
+        list[str]: The lines of the next block, including line endings.
+    """
+    while True:
+        lines = file.readlines(block_size)
+        if not lines:
+            return
+        yield lines
+
+
+def _materialize(items: Iterable[Any]) -> Any:
+    """Turn one-shot iterators into a list so NumPy sees the elements."""
+    if hasattr(items, "__len__") or isinstance(items, memoryview):
+        return items
+    return list(items)
+
+
+def _to_roman_list(numbers: Iterable[Any]) -> BatchResult:
+    """Pure Python fallback for to_roman_array."""
+    values: list[str] = []
+    valid: list[bool] = []
+    for number in numbers:
+        try:
+            index = operator.index(number)
+        except TypeError:
+            index = 0
+        is_valid = MIN_VALUE <= index <= MAX_VALUE
+        values.append(INT_TO_ROMAN[index] if is_valid else "")
+        valid.append(is_valid)
+    return BatchResult(values, valid)
+
+
+def _from_roman_list(romans: Iterable[Any]) -> BatchResult:
+    """Pure Python fallback for from_roman_array."""
+    values: list[int] = []
+    valid: list[bool] = []
+    for roman in romans:
+        decimal = ROMAN_TO_INT.get(roman, 0) if isinstance(roman, str) else 0
+        values.append(decimal)
+        valid.append(decimal > 0)
+    return BatchResult(values, valid)
+
+
+_ROMAN_TABLE: Any = None
+
+
+def _roman_table() -> Any:
+    """Get INT_TO_ROMAN as a NumPy object array, built on first use."""
+    global _ROMAN_TABLE
+    if _ROMAN_TABLE is None:
+        import numpy as np
+
+        _ROMAN_TABLE = np.array(INT_TO_ROMAN, dtype=object)
+    return _ROMAN_TABLE
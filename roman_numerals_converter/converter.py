@@ -1,38 +1,83 @@
 import random
 import re
 import string
+from functools import partial
+from typing import Callable, Iterable, Iterator, Pattern, TextIO, Union
 
-from roman_numerals_converter.roman import ROMAN_REGEX, RomanError, RomanNumeral
+from roman_numerals_converter.extended import (
+    MAX_LENGTH,
+    from_extended_roman,
+    to_extended_roman,
+)
+from roman_numerals_converter.roman import RomanError, RomanNumeral
+from roman_numerals_converter.tables import (
+    INT_TO_ROMAN,
+    MAX_VALUE,
+    MIN_VALUE,
+    ROMAN_TO_INT,
+)
 
+# A whitespace-delimited word made of Roman numeral letters, optionally wrapped
+# in punctuation, e.g. "XIV", "(XIV)" or "XIV." but not "XIV's" or "X-ray"
+_PUNCTUATION = f"[{re.escape(string.punctuation)}]*"
+ROMAN_WORD_PATTERN = re.compile(
+    rf"(?<!\S)(?P<prefix>{_PUNCTUATION})(?P<roman>[MDCLXVI]+)(?P<suffix>{_PUNCTUATION})(?!\S)"  # noqa: E501
+)
 
-def convert_to_roman(number: int) -> str:
+# Regular expression to find integers
+INTEGER_PATTERN = re.compile(r"\b\d+\b")
+
+# Characters that never occur inside a token, text can be split after them
+ROMAN_WORD_SEPARATOR = re.compile(r"\s")
+INTEGER_SEPARATOR = re.compile(r"\W")
+
+# Default size of the chunks read from file objects when streaming
+CHUNK_SIZE = 64 * 1024
+
+# Tokens longer than this are passed through unchanged when streaming
+MAX_TOKEN_LENGTH = 1024
+
+
+def convert_to_roman(
+    number: int, extended: bool = False, max_length: int = MAX_LENGTH
+) -> str:
     """
     Convert a decimal number to a Roman numeral.
 
     Args:
         number (int): The decimal number to convert.
+        extended (bool): Whether to write numbers above 3999 in vinculum notation.
+        max_length (int): The longest extended numeral to produce, in characters.
 
     Returns:
         str: The Roman numeral representation.
     """
     try:
+        if extended:
+            return to_extended_roman(number, max_length)
         roman_numeral = RomanNumeral.from_decimal(number)
         return str(roman_numeral)
     except RomanError as e:
         raise ValueError(f"Error converting to Roman: {str(e)}") from e
 
 
-def convert_from_roman(roman: str) -> int:
+def convert_from_roman(
+    roman: str, extended: bool = False, max_length: int = MAX_LENGTH
+) -> int:
     """
     Convert a Roman numeral to a decimal number.
 
     Args:
         roman (str): The Roman numeral to convert.
+        extended (bool): Whether to accept numerals in vinculum notation.
+        max_length (int): The longest extended numeral to accept, in characters.
 
     Returns:
         int: The decimal number representation.
     """
     try:
+        if extended:
+            return from_extended_roman(roman, max_length)
         roman_numeral = RomanNumeral(roman)
         return roman_numeral.to_decimal()
     except RomanError:
@@ -72,15 +117,15 @@ def replace_roman_numerals_with_integers_in_text(text: str) -> str:
     Returns:
         str: The text with Roman numerals replaced by decimal numbers.
     """
-    non_punctation_text = text.translate(str.maketrans("", "", string.punctuation))
-    for word in non_punctation_text.split():
-        if re.match(ROMAN_REGEX, word):
-            try:
-                decimal = convert_from_roman(word)
-                text = text.replace(word, str(decimal))
-            except ValueError:
-                pass
-    return text
+    return ROMAN_WORD_PATTERN.sub(_replace_roman_word, text)
+
+
+def _replace_roman_word(match: "re.Match[str]") -> str:
+    """Replace a matched Roman numeral word by its decimal value, if it is valid."""
+    decimal = ROMAN_TO_INT.get(match.group("roman"))
+    if decimal is None:
+        return match.group(0)
+    return f"{match.group('prefix')}{decimal}{match.group('suffix')}"
 
 
 def replace_integers_with_roman_numerals(text: str) -> str:
@@ -93,12 +138,146 @@ def replace_integers_with_roman_numerals(text: str) -> str:
     Returns:
         str: The text with integers replaced by Roman numerals.
     """
-    # Regular expression to find integers
-    INTEGER_REGEX = r"\b\d+\b"
 
     # Function to replace each integer with its Roman numeral equivalent
     def replace_integer(match):  # type: ignore
         integer = int(match.group(0))  # type: ignore
         return convert_to_roman(integer)
 
-    return re.sub(INTEGER_REGEX, replace_integer, text)  # type: ignore
+    return INTEGER_PATTERN.sub(replace_integer, text)  # type: ignore
+
+
+def replace_valid_integers_with_roman_numerals(text: str) -> str:
+    """
+    Replace the integers between 1 and 3999 in a text with Roman numerals.
+
+    Unlike replace_integers_with_roman_numerals, integers without a Roman numeral,
+    like 0 or 10000, are left unchanged instead of raising an error.
+
+    Args:
+        text (str): The text containing integers.
+
+    Returns:
+        str: The text with the integers in range replaced by Roman numerals.
+    """
+    return INTEGER_PATTERN.sub(_replace_integer_word, text)
+
+
+def _replace_integer_word(match: "re.Match[str]") -> str:
+    """Replace a matched integer by its Roman numeral, if it has one."""
+    integer = int(match.group(0))
+    if not MIN_VALUE <= integer <= MAX_VALUE:
+        return match.group(0)
+    return INT_TO_ROMAN[integer]
+
+
+def iter_replace_roman_numerals_with_integers(
+    chunks: Union[Iterable[str], TextIO], max_token_length: int = MAX_TOKEN_LENGTH
+) -> Iterator[str]:
+    """
+    Replace all Roman numerals in a stream of text chunks with their decimal equivalents.
+
+    Args:
+        chunks (Iterable[str] | TextIO): The text chunks or a text file object.
+        max_token_length (int): Tokens longer than this are passed through unchanged.
+
+    Yields:
+        str: The converted text, in chunks.
+    """  # noqa: E501
+    return _iter_replace(
+        chunks,
+        replace_roman_numerals_with_integers_in_text,
+        ROMAN_WORD_SEPARATOR,
+        max_token_length,
+    )
+
+
+def iter_replace_integers_with_roman_numerals(
+    chunks: Union[Iterable[str], TextIO], max_token_length: int = MAX_TOKEN_LENGTH
+) -> Iterator[str]:
+    """
+    Replace all integers in a stream of text chunks with their Roman numeral equivalents.
+
+    Integers without a Roman numeral, like 0 or 10000, are left unchanged, so
+    one of them does not abort the conversion of a large text.
+
+    Args:
+        chunks (Iterable[str] | TextIO): The text chunks or a text file object.
+        max_token_length (int): Tokens longer than this are passed through unchanged.
+
+    Yields:
+        str: The converted text, in chunks.
+    """  # noqa: E501
+    return _iter_replace(
+        chunks,
+        replace_valid_integers_with_roman_numerals,
+        INTEGER_SEPARATOR,
+        max_token_length,
+    )
+
+
+def _iter_replace(
+    chunks: Union[Iterable[str], TextIO],
+    replace: Callable[[str], str],
+    separator: Pattern[str],
+    max_token_length: int,
+) -> Iterator[str]:
+    """Apply a text replacement to a stream of chunks with bounded memory."""
+    for piece, convert in split_stream(chunks, separator, max_token_length):
+        yield replace(piece) if convert else piece
+
+
+def split_stream(
+    chunks: Union[Iterable[str], TextIO],
+    separator: Pattern[str],
+    max_token_length: int = MAX_TOKEN_LENGTH,
+) -> Iterator[tuple[str, bool]]:
+    """
+    Split a stream of text chunks into pieces that can be converted independently.
+
+    The text is only cut right after a separator character, which no token can
+    contain, so tokens split across chunk boundaries are carried over and
+    converted once they are complete.
+
+    Args:
+        chunks (Iterable[str] | TextIO): The text chunks or a text file object.
+        separator (Pattern[str]): Matches the characters no token can contain.
+        max_token_length (int): Tokens longer than this are passed through unchanged.
+
+    Yields:
+        tuple[str, bool]: A piece of text and whether it should be converted.
+    """  # noqa: E501
+    if hasattr(chunks, "read"):
+        chunks = iter(partial(chunks.read, CHUNK_SIZE), "")  # type: ignore
+
+    carry = ""
+    skipping = False
+    for chunk in chunks:
+        buffer = carry + chunk
+        carry = ""
+
+        if skipping:
+            # Pass through the rest of a token that was too long to convert
+            match = separator.search(buffer)
+            if match is None:
+                yield buffer, False
+                continue
+            if match.start():
+                yield buffer[: match.start()], False
+            buffer = buffer[match.start() :]
+            skipping = False
+
+        # Cut after the last separator, searching backwards from the end
+        match = separator.search(buffer[::-1])
+        split = len(buffer) - match.start() if match else 0
+        if split:
+            yield buffer[:split], True
+
+        carry = buffer[split:]
+        if len(carry) > max_token_length:
+            yield carry, False
+            carry = ""
+            skipping = True
+
+    if carry:
+        yield carry, True
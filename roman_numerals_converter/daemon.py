@@ -0,0 +1,255 @@
+"""Conversion daemon listening on a Unix domain socket.
+A long-lived process answers conversion requests so that shell pipelines do not
+pay the interpreter startup for every value. The protocol is line based: a request
+is a direction followed by values separated by spaces, e.g. "to-roman 1 2 3", and
+the answer is one line with the results in the same order, invalid values being
+replaced by INVALID_MARKER. Malformed requests are answered with a line starting
+with ERROR_PREFIX.
+"""  # noqa: E501
+
+import contextlib
+import os
+import socket
+import socketserver
+from itertools import islice
+from typing import Iterable, Iterator, Optional, TextIO
+
+from .batch import INVALID_MARKER as INVALID_MARKER
+from .batch import convert_lines
+
+HAS_UNIX_SOCKETS = hasattr(socket, "AF_UNIX")
+
+# Answers to malformed requests start with this
+ERROR_PREFIX = "#ERROR"
+
+# Longest request line the daemon reads, in bytes
+MAX_REQUEST_LENGTH = 1024 * 1024
+
+# Number of values the client sends per round trip
+BATCH_SIZE = 1000
+
+# No valid value is this long, longer ones are sent as an invalid placeholder
+MAX_VALUE_LENGTH = 32
+
+# Seconds the client waits for the daemon
+TIMEOUT = 10.0
+
+
+def default_socket_path() -> str:
+    """Get the socket path from ROMAN_NUMERALS_SOCKET or a per-user default.
+    The default is in $XDG_RUNTIME_DIR, which only the user can access. Without
+    it the socket is put in the shared temporary directory, where its owner is
+    checked before connecting.
+    Returns:
+        str: The path of the Unix domain socket.
+    """
+    path = os.environ.get("ROMAN_NUMERALS_SOCKET")
+    if path:
+        return path
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "roman-numerals.sock")
+    import tempfile
+
+    user = getattr(os, "getuid", lambda: "user")()
+    return os.path.join(tempfile.gettempdir(), f"roman-numerals-{user}.sock")
+
+
+def check_socket_owner(socket_path: str) -> None:
+    """Refuse a socket created by another user, who could answer with spoofed results.
+    Args:
+        socket_path (str): The path of an existing socket.
+    Raises:
+        PermissionError: If the socket belongs to another user.
+    """  # noqa: E501
+    if not hasattr(os, "getuid"):
+        return
+    owner = os.stat(socket_path).st_uid
+    if owner != os.getuid():
+        raise PermissionError(
+            f"The socket {socket_path} belongs to another user (uid {owner})."
+        )
+
+
+def handle_request(line: str) -> str:
+    """Answer one request line of the protocol.
+    Args:
+        line (str): The direction followed by the values, separated by whitespace.
+    Returns:
+        str: The results separated by spaces, or an error starting with ERROR_PREFIX.
+    """  # noqa: E501
+    words = line.split()
+    if not words:
+        return f"{ERROR_PREFIX} Empty request."
+    try:
+        converted, _ = convert_lines(words[1:], words[0], on_error="mark")
+    except ValueError as e:
+        return f"{ERROR_PREFIX} {e}"
+    return " ".join(converted)
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Answer the request lines of one connection until the client closes it."""
+
+    def handle(self) -> None:
+        try:
+            while True:
+                line = self.rfile.readline(MAX_REQUEST_LENGTH + 1)
+                if not line:
+                    return
+                if len(line) > MAX_REQUEST_LENGTH:
+                    error = f"{ERROR_PREFIX} Request too long.\n"
+                    self.wfile.write(error.encode("utf-8"))
+                    return
+                answer = handle_request(line.decode("utf-8", errors="replace"))
+                self.wfile.write(answer.encode("utf-8") + b"\n")
+        except (BrokenPipeError, ConnectionResetError):
+            # The client went away before reading the answer
+            return
+
+
+def make_server(socket_path: Optional[str] = None) -> socketserver.BaseServer:
+    """Create the daemon's server, removing a stale socket file first.
+    Args:
+        socket_path (str, optional): The path of the socket, see default_socket_path.
+    Returns:
+        socketserver.BaseServer: The bound server, one thread per connection.
+    Raises:
+        RuntimeError: If Unix domain sockets are not supported or another daemon listens on the path.
+    """  # noqa: E501
+    if not HAS_UNIX_SOCKETS:
+        raise RuntimeError("Unix domain sockets are not supported on this platform.")
+    socket_path = socket_path or default_socket_path()
+    if os.path.exists(socket_path):
+        try:
+            check_socket_owner(socket_path)
+        except PermissionError as e:
+            raise RuntimeError(str(e)) from e
+        try:
+            DaemonClient(socket_path).close()
+        except OSError:
+            os.unlink(socket_path)
+        else:
+            raise RuntimeError(f"A daemon is already listening on {socket_path}.")
+
+    server = socketserver.ThreadingUnixStreamServer(socket_path, _RequestHandler)
+    server.daemon_threads = True
+    os.chmod(socket_path, 0o600)
+    return server
+
+
+def run_server(server: socketserver.BaseServer) -> None:
+    """Serve requests until the server is shut down, then remove the socket file.
+    Args:
+        server (socketserver.BaseServer): A server from make_server.
+    """
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(server.server_address)  # type: ignore
+
+
+class DaemonClient:
+    """A connection to the daemon, reused for many requests.
+
+    Raises:
+        OSError: If no daemon is listening on the socket.
+        PermissionError: If the socket belongs to another user.
+    """
+
+    def __init__(
+        self, socket_path: Optional[str] = None, timeout: float = TIMEOUT
+    ) -> None:
+        if not HAS_UNIX_SOCKETS:
+            raise ConnectionError("Unix domain sockets are not supported.")
+        socket_path = socket_path or default_socket_path()
+        check_socket_owner(socket_path)
+        self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.socket.settimeout(timeout)
+        try:
+            self.socket.connect(socket_path)
+        except OSError:
+            self.socket.close()
+            raise
+        self._file = self.socket.makefile("rwb")
+
+    def __enter__(self) -> "DaemonClient":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the connection."""
+        if hasattr(self, "_file"):
+            self._file.close()
+        self.socket.close()
+
+    def convert(self, direction: str, values: Iterable[str]) -> list[str]:
+        """Convert values in one round trip.
+        Args:
+            direction (str): Either "to-roman" or "from-roman".
+            values (Iterable[str]): The values to convert.
+        Returns:
+            list[str]: The results in order, INVALID_MARKER for invalid values.
+        Raises:
+            ValueError: If the daemon rejects the request.
+            ConnectionError: If the daemon closes the connection.
+        """
+        encoded = [_encode_value(value) for value in values]
+        self._file.write(" ".join([direction, *encoded]).encode("utf-8") + b"\n")
+        self._file.flush()
+        answer = self._file.readline()
+        if not answer.endswith(b"\n"):
+            raise ConnectionError("The daemon closed the connection.")
+        text = answer.decode("utf-8").rstrip("\n")
+        if text.startswith(ERROR_PREFIX):
+            raise ValueError(text[len(ERROR_PREFIX) :].strip())
+        return text.split(" ") if encoded else []
+
+
+def iter_convert(
+    direction: str, blocks: Iterable[list[str]], socket_path: Optional[str] = None
+) -> Iterator[list[str]]:
+    """Convert blocks of values with the daemon, or in this process if it is absent.
+    Args:
+        direction (str): Either "to-roman" or "from-roman".
+        blocks (Iterable[list[str]]): The values, one round trip per block.
+        socket_path (str, optional): The path of the socket, see default_socket_path.
+    Yields:
+        list[str]: The results of each block, INVALID_MARKER for invalid values.
+    Raises:
+        ValueError: If the direction is unknown.
+    """  # noqa: E501
+    try:
+        client = DaemonClient(socket_path)
+    except OSError:
+        for block in blocks:
+            yield convert_lines(block, direction, on_error="mark")[0]
+        return
+
+    with client:
+        for block in blocks:
+            yield client.convert(direction, block)
+
+
+def read_value_blocks(file: TextIO, size: int = BATCH_SIZE) -> Iterator[list[str]]:
+    """Read a text file in blocks of lines for iter_convert.
+    Args:
+        file (TextIO): The file to read, one value per line.
+        size (int): The number of lines per block.
+    Yields:
+        list[str]: The lines of the next block.
+    """
+    while block := list(islice(file, size)):
+        yield block
+
+
+def _encode_value(value: str) -> str:
+    """Make a value safe for the protocol, values that cannot be valid become "-"."""
+    value = value.strip()
+    if not value or len(value) > MAX_VALUE_LENGTH or len(value.split()) != 1:
+        return "-"
+    return value
@@ -0,0 +1,124 @@
+"""Extended Roman numerals in vinculum notation.
+Every line over a numeral multiplies it by 1000, so a letter with two lines is
+worth a million times its value and numbers of any size can be written, e.g. 4000
+is I̅V̅ and 10**18 is an M with five lines. The lines are written as combining
+overlines (U+0305) after every letter. A number is split into groups of three
+decimal digits, the group of each power of 1000 is looked up in the standard table
+and overlined, so formatting and parsing cost O(log n). The length of the numerals
+is capped, which bounds the work for hostile input. Values below 4000 are written
+as standard numerals and every value has exactly one valid spelling.
+"""  # noqa: E501
+
+import re
+
+from .roman import RomanError
+from .tables import INT_TO_ROMAN, MAX_VALUE, MIN_VALUE, ROMAN_TO_INT
+
+# Combining overline, marks the preceding letter as multiplied by 1000
+OVERLINE = "\u0305"
+
+# Longest numeral, in characters, that is formatted or parsed by default
+MAX_LENGTH = 1000
+
+# A run of letters with the same number of overlines
+GROUP_PATTERN = re.compile(f"[MDCLXVI]({OVERLINE}*)(?:[MDCLXVI]\\1(?!{OVERLINE}))*")
+
+# Bits per overline level, an upper bound for log2(1000)
+_BITS_PER_LEVEL = 10
+
+
+def to_extended_roman(number: int, max_length: int = MAX_LENGTH) -> str:
+    """Convert a decimal number to an extended Roman numeral.
+    Args:
+        number (int): A positive decimal number.
+        max_length (int): The longest numeral to produce, in characters.
+    Returns:
+        str: The Roman numeral, with a vinculum per factor of 1000 above 3999.
+    Raises:
+        RomanError: If the number is not a positive integer or its numeral is longer than max_length.
+    """  # noqa: E501
+    if not isinstance(number, int) or isinstance(number, bool):
+        raise RomanError("Number must be an integer.")
+    if number < MIN_VALUE:
+        raise RomanError("Number must be positive.")
+    if number <= MAX_VALUE:
+        return INT_TO_ROMAN[number]
+
+    # Every level adds at least one character, reject huge numbers before splitting
+    if number.bit_length() > _BITS_PER_LEVEL * (max_length + 2):
+        raise _too_long(max_length)
+
+    groups: list[int] = []
+    while number:
+        number, group = divmod(number, 1000)
+        groups.append(group)
+    # The top group takes up to three thousands of the next one, like MMM
+    if groups[-1] < 4:
+        top = groups.pop()
+        groups[-1] += top * 1000
+
+    length = sum(
+        len(INT_TO_ROMAN[group]) * (level + 1) for level, group in enumerate(groups)
+    )
+    if length > max_length:
+        raise _too_long(max_length)
+
+    parts = []
+    for level in range(len(groups) - 1, 0, -1):
+        roman = INT_TO_ROMAN[groups[level]]
+        if roman:
+            marks = OVERLINE * level
+            parts.append(marks.join(roman) + marks)
+    parts.append(INT_TO_ROMAN[groups[0]])
+    return "".join(parts)
+
+
+def from_extended_roman(value: str, max_length: int = MAX_LENGTH) -> int:
+    """Convert an extended Roman numeral to a decimal number.
+    Args:
+        value (str): A standard Roman numeral or one with vincula.
+        max_length (int): The longest numeral to accept, in characters.
+    Returns:
+        int: The decimal representation.
+    Raises:
+        RomanError: If the string is not a valid extended Roman numeral or longer than max_length.
+    """  # noqa: E501
+    if not isinstance(value, str):  # type: ignore
+        raise RomanError("Please enter a string.")
+    if len(value) > max_length:
+        raise _too_long(max_length)
+
+    number = 0
+    position = 0
+    while position < len(value):
+        match = GROUP_PATTERN.match(value, position)
+        if match is None:
+            raise RomanError("Please enter a valid Roman numeral.")
+        level = len(match.group(1))
+        group = ROMAN_TO_INT.get(match.group()[:: level + 1], 0)
+        number += group * 1000**level
+        position = match.end()
+
+    # Rejects invalid groups as well as non-canonical spellings like I̅ for M
+    if number == 0 or to_extended_roman(number, max_length) != value:
+        raise RomanError("Please enter a valid Roman numeral.")
+    return number
+
+
+def is_valid_extended_roman(value: str, max_length: int = MAX_LENGTH) -> bool:
+    """Check if a string is a valid extended Roman numeral.
+    Args:
+        value (str): A string to be checked.
+        max_length (int): The longest numeral to accept, in characters.
+    Returns:
+        bool: True if the string is the canonical spelling of a number, False otherwise.
+    """  # noqa: E501
+    try:
+        from_extended_roman(value, max_length)
+    except RomanError:
+        return False
+    return True
+
+
+def _too_long(max_length: int) -> RomanError:
+    return RomanError(f"Roman numeral would be longer than {max_length} characters.")
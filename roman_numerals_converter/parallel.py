@@ -0,0 +1,225 @@
+"""Parallel conversion of Roman numerals.
+This module splits large inputs into chunks and converts them in a pool of worker
+processes. Results are always returned in the order of the input.
+"""  # noqa: E501
+
+import os
+from collections import deque
+from functools import partial
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    TextIO,
+    TypeVar,
+    Union,
+)
+
+from .batch import convert_lines
+from .converter import (
+    INTEGER_SEPARATOR,
+    MAX_TOKEN_LENGTH,
+    ROMAN_WORD_SEPARATOR,
+    convert_from_roman,
+    convert_to_roman,
+    replace_roman_numerals_with_integers_in_text,
+    replace_valid_integers_with_roman_numerals,
+    split_stream,
+)
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Number of values sent to a worker at once
+CHUNK_SIZE = 10_000
+
+
+def parallel_map(
+    function: Callable[[T], R], items: Iterable[T], workers: Optional[int] = None
+) -> Iterator[R]:
+    """
+    Apply a function to every item in worker processes, preserving the order.
+
+    Args:
+        function (Callable): A picklable function, e.g. defined at module level.
+        items (Iterable): The items, consumed lazily.
+        workers (int, optional): The number of processes, defaults to the CPU count. With 1 the items are processed in this process.
+
+    Yields:
+        The results in the order of the items.
+    """  # noqa: E501
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        yield from map(function, items)
+        return
+
+    # Imported here as it pulls in multiprocessing, which single process runs never use
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Keep a bounded number of items in flight so memory does not grow with the input
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: deque[Future[R]] = deque()
+        for item in items:
+            pending.append(executor.submit(function, item))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def convert_to_roman_parallel(
+    numbers: Iterable[int], workers: Optional[int] = None, chunk_size: int = CHUNK_SIZE
+) -> list[str]:
+    """
+    Convert many decimal numbers to Roman numerals in parallel.
+
+    Args:
+        numbers (Iterable[int]): The decimal numbers to convert.
+        workers (int, optional): The number of processes, defaults to the CPU count.
+        chunk_size (int): The number of values sent to a worker at once.
+
+    Returns:
+        list[str]: The Roman numerals, in order.
+
+    Raises:
+        ValueError: If a number cannot be converted.
+    """
+    return _flatten(
+        parallel_map(_to_roman_chunk, _chunked(numbers, chunk_size), workers)
+    )
+
+
+def convert_from_roman_parallel(
+    romans: Iterable[str], workers: Optional[int] = None, chunk_size: int = CHUNK_SIZE
+) -> list[int]:
+    """
+    Convert many Roman numerals to decimal numbers in parallel.
+
+    Args:
+        romans (Iterable[str]): The Roman numerals to convert.
+        workers (int, optional): The number of processes, defaults to the CPU count.
+        chunk_size (int): The number of values sent to a worker at once.
+
+    Returns:
+        list[int]: The decimal numbers, in order.
+
+    Raises:
+        ValueError: If a Roman numeral is invalid.
+    """
+    return _flatten(
+        parallel_map(_from_roman_chunk, _chunked(romans, chunk_size), workers)
+    )
+
+
+def convert_line_blocks(
+    blocks: Iterable[list[str]],
+    direction: str,
+    on_error: str = "fail",
+    workers: Optional[int] = None,
+) -> Iterator[tuple[list[str], int, int]]:
+    """
+    Convert blocks of newline-delimited values in parallel, see batch.convert_lines.
+
+    Args:
+        blocks (Iterable[list[str]]): The blocks of lines, e.g. from batch.read_line_blocks.
+        direction (str): Either "to-roman" or "from-roman".
+        on_error (str): How to handle invalid lines, one of "skip", "mark" or "fail".
+        workers (int, optional): The number of processes, defaults to the CPU count.
+
+    Yields:
+        tuple[list[str], int, int]: For each block the converted lines, the number of invalid lines and the number of input lines.
+    """  # noqa: E501
+
+    def numbered_blocks() -> Iterator[tuple[list[str], int]]:
+        first_line = 1
+        for lines in blocks:
+            yield lines, first_line
+            first_line += len(lines)
+
+    convert = partial(_convert_line_block, direction=direction, on_error=on_error)
+    return parallel_map(convert, numbered_blocks(), workers)
+
+
+def replace_roman_numerals_parallel(
+    chunks: Union[Iterable[str], TextIO],
+    workers: Optional[int] = None,
+    max_token_length: int = MAX_TOKEN_LENGTH,
+) -> Iterator[str]:
+    """
+    Replace all Roman numerals in a stream of text chunks in parallel.
+
+    Args:
+        chunks (Iterable[str] | TextIO): The text chunks or a text file object.
+        workers (int, optional): The number of processes, defaults to the CPU count.
+        max_token_length (int): Tokens longer than this are passed through unchanged.
+
+    Yields:
+        str: The converted text, in chunks.
+    """
+    pieces = split_stream(chunks, ROMAN_WORD_SEPARATOR, max_token_length)
+    replace = partial(_replace_piece, replace_roman_numerals_with_integers_in_text)
+    return parallel_map(replace, pieces, workers)
+
+
+def replace_integers_parallel(
+    chunks: Union[Iterable[str], TextIO],
+    workers: Optional[int] = None,
+    max_token_length: int = MAX_TOKEN_LENGTH,
+) -> Iterator[str]:
+    """
+    Replace all integers in a stream of text chunks in parallel.
+
+    Integers without a Roman numeral are left unchanged, like in
+    iter_replace_integers_with_roman_numerals.
+
+    Args:
+        chunks (Iterable[str] | TextIO): The text chunks or a text file object.
+        workers (int, optional): The number of processes, defaults to the CPU count.
+        max_token_length (int): Tokens longer than this are passed through unchanged.
+
+    Yields:
+        str: The converted text, in chunks.
+    """
+    pieces = split_stream(chunks, INTEGER_SEPARATOR, max_token_length)
+    replace = partial(_replace_piece, replace_valid_integers_with_roman_numerals)
+    return parallel_map(replace, pieces, workers)
+
+
+def _chunked(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Split an iterable into lists of at most size items."""
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _flatten(chunks: Iterable[list[Any]]) -> list[Any]:
+    """Concatenate a sequence of lists."""
+    return [item for chunk in chunks for item in chunk]
+
+
+def _to_roman_chunk(numbers: list[int]) -> list[str]:
+    return [convert_to_roman(number) for number in numbers]
+
+
+def _from_roman_chunk(romans: list[str]) -> list[int]:
+    return [convert_from_roman(roman) for roman in romans]
+
+
+def _convert_line_block(
+    block: tuple[list[str], int], direction: str, on_error: str
+) -> tuple[list[str], int, int]:
+    lines, first_line = block
+    converted, invalid = convert_lines(lines, direction, on_error, first_line)
+    return converted, invalid, len(lines)
+
+
+def _replace_piece(replace: Callable[[str], str], piece: tuple[str, bool]) -> str:
+    text, convert = piece
+    return replace(text) if convert else text
@@ -2,11 +2,11 @@
 This script provides a command-line interface to convert numbers to Roman numerals and vice versa.
 """  # noqa: E501
 
-import re
 from typing import Union
 
-# Regular expression for validating Roman numerals
-ROMAN_REGEX = r"^(?=.)M{0,3}(C[MD]|D?C{0,3})(X[CL]|L?X{0,3})(I[XV]|V?I{0,3})$"
+from .tables import INT_TO_ROMAN, MAX_VALUE, MIN_VALUE, ROMAN_TO_INT
+from .validation import ROMAN_REGEX as ROMAN_REGEX
+from .validation import is_valid_roman
 
 
 class RomanError(Exception):
@@ -20,8 +20,13 @@ class RomanNumeral:
     This class provides a constructor for creating a RomanNumeral object from a
     Roman numeral or a decimal number. It also provides methods for converting
     a Roman numeral to a decimal number and vice versa.
+
+    Instances are immutable and interned: every valid value is preallocated
+    once, so equal numerals share a single object.
     """
 
+    __slots__ = ("_value", "_decimal")
+
     ROMAN_INT_MAP = [
         ("M", 1000),
         ("CM", 900),
@@ -55,7 +60,10 @@ class RomanNumeral:
         (1, "I"),
     ]
 
-    def __init__(self, value: str) -> None:
+    _value: str
+    _decimal: int
+
+    def __new__(cls, value: str) -> "RomanNumeral":
         """Constructor for RomanNumeral class.
         Args:
             value (str): A Roman numeral or a decimal number.
@@ -65,25 +73,24 @@ class RomanNumeral:
             raise RomanError("Please enter a string.")
 
         # Check if the input is a Roman numeral
-        if not self.is_valid_roman(value):
+        if not cls.is_valid_roman(value):
             raise RomanError("Please enter a valid Roman numeral.")
 
-        self._value = value
+        return cls._from_trusted(ROMAN_TO_INT[value])
+
+    def __reduce__(self) -> tuple[type["RomanNumeral"], tuple[str]]:
+        """Support pickling and copying, unpickled values are interned again.
+        Returns:
+            tuple: The class and the arguments to recreate the object.
+        """
+        return (type(self), (self._value,))
 
     def to_decimal(self) -> int:
         """Convert a Roman numeral to a decimal number.
         Returns:
             int: The decimal representation of the Roman numeral.
         """
-        roman_value = self._value
-        # Conversion process
-        decimal = 0
-        for numeral, value in self.ROMAN_INT_MAP:
-            while roman_value.startswith(numeral):
-                decimal += value
-                roman_value = roman_value[len(numeral) :]
-
-        return decimal
+        return self._decimal
 
     def __str__(self) -> str:
         """Convert a Roman numeral to a string.
@@ -107,13 +114,13 @@ class RomanNumeral:
             bool: True if the two objects are equal, False otherwise.
         """
         if isinstance(other, RomanNumeral):
-            return self._value == other._value
+            return self._decimal == other._decimal
 
         if isinstance(other, str):
             return self._value == other
 
         if isinstance(other, int):
-            return self.to_decimal() == other
+            return self._decimal == other
 
         return NotImplemented
 
@@ -125,16 +132,40 @@ class RomanNumeral:
             bool: True if the two objects are not equal, False otherwise.
         """
         if isinstance(other, RomanNumeral):
-            return self._value != other._value
+            return self._decimal != other._decimal
 
         if isinstance(other, str):
             return self._value != other
 
         if isinstance(other, int):
-            return self.to_decimal() != other
+            return self._decimal != other
 
         return NotImplemented
 
+    def __hash__(self) -> int:
+        """Hash a RomanNumeral object like its decimal value.
+        This keeps it interchangeable with int keys in sets and dicts. Equality
+        with a str is not hash-consistent: RomanNumeral("X") == "X", but "X" is
+        not found in a set or dict keyed by RomanNumeral objects, or the reverse.
+        Returns:
+            int: The hash of the decimal value.
+        """
+        return hash(self._decimal)
+
+    def __int__(self) -> int:
+        """Convert a RomanNumeral object to an integer.
+        Returns:
+            int: The decimal representation of the object.
+        """
+        return self._decimal
+
+    def __index__(self) -> int:
+        """Use a RomanNumeral object wherever an integer index is expected.
+        Returns:
+            int: The decimal representation of the object.
+        """
+        return self._decimal
+
     def __lt__(self, other: object) -> bool:
         """Compare two RomanNumeral objects.
         Args:
@@ -143,13 +174,13 @@ class RomanNumeral:
             bool: True if the first object is less than the second object, False otherwise.
         """  # noqa: E501
         if isinstance(other, RomanNumeral):
-            return self.to_decimal() < other.to_decimal()
+            return self._decimal < other._decimal
 
         if isinstance(other, str):
-            return self.to_decimal() < RomanNumeral(other).to_decimal()
+            return self._decimal < self._parse(other)
 
         if isinstance(other, int):
-            return self.to_decimal() < other
+            return self._decimal < other
 
         return NotImplemented
 
@@ -161,13 +192,13 @@ class RomanNumeral:
             bool: True if the first object is less than or equal to the second object, False otherwise.
         """  # noqa: E501
         if isinstance(other, RomanNumeral):
-            return self.to_decimal() <= other.to_decimal()
+            return self._decimal <= other._decimal
 
         if isinstance(other, str):
-            return self.to_decimal() <= RomanNumeral(other).to_decimal()
+            return self._decimal <= self._parse(other)
 
         if isinstance(other, int):
-            return self.to_decimal() <= other
+            return self._decimal <= other
 
         return NotImplemented
 
@@ -179,13 +210,13 @@ class RomanNumeral:
             bool: True if the first object is greater than the second object, False otherwise.
         """  # noqa: E501
         if isinstance(other, RomanNumeral):
-            return self.to_decimal() > other.to_decimal()
+            return self._decimal > other._decimal
 
         if isinstance(other, str):
-            return self.to_decimal() > RomanNumeral(other).to_decimal()
+            return self._decimal > self._parse(other)
 
         if isinstance(other, int):
-            return self.to_decimal() > other
+            return self._decimal > other
 
         return NotImplemented
 
@@ -197,13 +228,13 @@ class RomanNumeral:
             bool: True if the first object is greater than or equal to the second object, False otherwise.
         """  # noqa: E501
         if isinstance(other, RomanNumeral):
-            return self.to_decimal() >= other.to_decimal()
+            return self._decimal >= other._decimal
 
         if isinstance(other, str):
-            return self.to_decimal() >= RomanNumeral(other).to_decimal()
+            return self._decimal >= self._parse(other)
 
         if isinstance(other, int):
-            return self.to_decimal() >= other
+            return self._decimal >= other
 
         return NotImplemented
 
@@ -220,13 +251,13 @@ class RomanNumeral:
         sum: int = 0
 
         if isinstance(other, RomanNumeral):
-            sum = self.to_decimal() + other.to_decimal()
+            sum = self._decimal + other._decimal
 
         if isinstance(other, str):
-            sum = self.to_decimal() + RomanNumeral(other).to_decimal()
+            sum = self._decimal + self._parse(other)
 
         if isinstance(other, int):
-            sum = self.to_decimal() + other
+            sum = self._decimal + other
 
         assert 0 < sum < 4000, "Addition result must be between 1 and 3999."
 
@@ -244,7 +275,7 @@ class RomanNumeral:
             return other + self.__str__()
 
         if isinstance(other, int):
-            return other + self.to_decimal()
+            return other + self._decimal
 
         return NotImplemented
 
@@ -261,13 +292,13 @@ class RomanNumeral:
         difference: int = 0
 
         if isinstance(other, RomanNumeral):
-            difference = self.to_decimal() - other.to_decimal()
+            difference = self._decimal - other._decimal
 
         if isinstance(other, str):
-            difference = self.to_decimal() - RomanNumeral(other).to_decimal()
+            difference = self._decimal - self._parse(other)
 
         if isinstance(other, int):
-            difference = self.to_decimal() - other
+            difference = self._decimal - other
 
         assert 0 < difference < 4000, "Subtraction result must be between 1 and 3999."
 
@@ -283,7 +314,7 @@ class RomanNumeral:
         if not isinstance(other, int):
             return NotImplemented
 
-        return other - self.to_decimal()
+        return other - self._decimal
 
     def __mul__(self, other: object) -> "RomanNumeral":
         """Multiply RomanNumeral by Int | Str | RomanNumeral.
@@ -298,13 +329,13 @@ class RomanNumeral:
         product: int = 0
 
         if isinstance(other, RomanNumeral):
-            product = self.to_decimal() * other.to_decimal()
+            product = self._decimal * other._decimal
 
         if isinstance(other, str):
-            product = self.to_decimal() * RomanNumeral(other).to_decimal()
+            product = self._decimal * self._parse(other)
 
         if isinstance(other, int):
-            product = self.to_decimal() * other
+            product = self._decimal * other
 
         assert 0 < product < 4000, "Multiplication result must be between 1 and 3999."
 
@@ -323,13 +354,13 @@ class RomanNumeral:
         product: int = 0
 
         if isinstance(other, RomanNumeral):
-            product = self.to_decimal() * other.to_decimal()
+            product = self._decimal * other._decimal
 
         if isinstance(other, str):
-            product = self.to_decimal() * RomanNumeral(other).to_decimal()
+            product = self._decimal * self._parse(other)
 
         if isinstance(other, int):
-            product = self.to_decimal() * other
+            product = self._decimal * other
 
         assert 0 < product < 4000, "Multiplication result must be between 1 and 3999."
 
@@ -348,13 +379,13 @@ class RomanNumeral:
         quotient: int = 0
 
         if isinstance(other, RomanNumeral):
-            quotient = self.to_decimal() // other.to_decimal()
+            quotient = self._decimal // other._decimal
 
         if isinstance(other, str):
-            quotient = self.to_decimal() // RomanNumeral(other).to_decimal()
+            quotient = self._decimal // self._parse(other)
 
         if isinstance(other, int):
-            quotient = self.to_decimal() // other
+            quotient = self._decimal // other
 
         assert 0 < quotient < 4000, "Division result must be between 1 and 3999."
 
@@ -373,16 +404,31 @@ class RomanNumeral:
         quotient: float = 0
 
         if isinstance(other, RomanNumeral):
-            quotient = other.to_decimal() / self.to_decimal()
+            quotient = other._decimal / self._decimal
 
         if isinstance(other, str):
-            quotient = RomanNumeral(other).to_decimal() / self.to_decimal()
+            quotient = self._parse(other) / self._decimal
 
         if isinstance(other, int):
-            quotient = other / self.to_decimal()
+            quotient = other / self._decimal
 
         return quotient
 
+    @staticmethod
+    def _parse(value: str) -> int:
+        """Look up the decimal value of a Roman numeral string.
+        Args:
+            value (str): A Roman numeral.
+        Returns:
+            int: The decimal representation of the Roman numeral.
+        Raises:
+            RomanError: If the string is not a valid Roman numeral.
+        """
+        decimal = ROMAN_TO_INT.get(value)
+        if decimal is None:
+            raise RomanError("Please enter a valid Roman numeral.")
+        return decimal
+
     @staticmethod
     def is_valid_roman(value: str) -> bool:
         """Check if a string is a valid Roman numeral.
@@ -391,7 +437,7 @@ class RomanNumeral:
         Returns:
             bool: True if the string is a valid Roman numeral, False otherwise.
         """
-        return bool(re.search(ROMAN_REGEX, value) is not None)
+        return is_valid_roman(value)
 
     @classmethod
     def from_decimal(cls, number: int) -> "RomanNumeral":
@@ -405,14 +451,39 @@ class RomanNumeral:
             raise RomanError("Number must be an integer.")
 
         # Check that the number is within the valid range
-        if not 0 < number < 4000:
+        if not MIN_VALUE <= number <= MAX_VALUE:
             raise RomanError("Number must be between 1 and 3999.")
 
-        # Conversion process
-        roman = ""
-        for value, numeral in cls.INT_ROMAN_MAP:
-            while number >= value:
-                roman += numeral
-                number -= value
+        return cls._from_trusted(number)
+
+    @classmethod
+    def _from_trusted(cls, number: int) -> "RomanNumeral":
+        """Get the RomanNumeral for a number without validating the input.
+        Only use this for numbers already checked to be between 1 and 3999.
+        Args:
+            number (int): A decimal number.
+        Returns:
+            RomanNumeral: The interned RomanNumeral object.
+        """
+        if cls is RomanNumeral:
+            return _POOL[number - MIN_VALUE]
+        return cls._allocate(number)
+
+    @classmethod
+    def _allocate(cls, number: int) -> "RomanNumeral":
+        """Allocate a new RomanNumeral, bypassing the pool.
+        Args:
+            number (int): A decimal number between 1 and 3999.
+        Returns:
+            RomanNumeral: The new RomanNumeral object.
+        """
+        roman_numeral = object.__new__(cls)
+        roman_numeral._value = INT_TO_ROMAN[number]
+        roman_numeral._decimal = number
+        return roman_numeral
+
 
-        return cls(roman)
+# Preallocated pool of every RomanNumeral, indexed by the decimal value minus one
+_POOL: tuple[RomanNumeral, ...] = tuple(
+    RomanNumeral._allocate(number) for number in range(MIN_VALUE, MAX_VALUE + 1)
+)
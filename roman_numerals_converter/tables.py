@@ -0,0 +1,37 @@
+"""Precomputed lookup tables for Roman numerals.
+The supported domain is small (1-3999), so every conversion can be answered with
+a table lookup instead of a loop. The tables are built once at import time.
+"""  # noqa: E501
+
+MIN_VALUE = 1
+MAX_VALUE = 3999
+
+# Per-digit tables, indexed by the value of the decimal digit
+THOUSANDS = ("", "M", "MM", "MMM")
+HUNDREDS = ("", "C", "CC", "CCC", "CD", "D", "DC", "DCC", "DCCC", "CM")
+TENS = ("", "X", "XX", "XXX", "XL", "L", "LX", "LXX", "LXXX", "XC")
+UNITS = ("", "I", "II", "III", "IV", "V", "VI", "VII", "VIII", "IX")
+
+
+def compose(number: int) -> str:
+    """Compose the Roman numeral for a number from the per-digit tables.
+    Args:
+        number (int): A decimal number between 0 and 3999.
+    Returns:
+        str: The Roman numeral representation (empty for 0).
+    """
+    return (
+        THOUSANDS[number // 1000]
+        + HUNDREDS[number // 100 % 10]
+        + TENS[number // 10 % 10]
+        + UNITS[number % 10]
+    )
+
+
+# Mapping of decimal numbers to Roman numerals, index 0 holds the empty string
+INT_TO_ROMAN: tuple[str, ...] = tuple(compose(n) for n in range(MAX_VALUE + 1))
+
+# Mapping of Roman numerals to decimal numbers
+ROMAN_TO_INT: dict[str, int] = {
+    roman: number for number, roman in enumerate(INT_TO_ROMAN) if number
+}
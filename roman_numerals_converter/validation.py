@@ -0,0 +1,37 @@
+"""Validation of Roman numerals.
+This module provides the shared validators for Roman numerals: a precompiled
+regular expression and a faster set membership test over all valid spellings.
+"""  # noqa: E501
+
+import re
+
+from .tables import ROMAN_TO_INT
+
+# Regular expression for validating Roman numerals
+ROMAN_REGEX = r"^(?=.)M{0,3}(C[MD]|D?C{0,3})(X[CL]|L?X{0,3})(I[XV]|V?I{0,3})$"
+
+# Precompiled pattern, avoids the lookup in the re module cache on every call
+ROMAN_PATTERN = re.compile(ROMAN_REGEX)
+
+# Every valid Roman numeral between 1 and 3999
+VALID_ROMAN_NUMERALS: frozenset[str] = frozenset(ROMAN_TO_INT)
+
+
+def is_valid_roman(value: str) -> bool:
+    """Check if a string is a valid Roman numeral using a set membership test.
+    Args:
+        value (str): A string to be checked.
+    Returns:
+        bool: True if the string is a valid Roman numeral, False otherwise.
+    """
+    return value in VALID_ROMAN_NUMERALS
+
+
+def matches_roman_pattern(value: str) -> bool:
+    """Check if a string is a valid Roman numeral using the compiled pattern.
+    Args:
+        value (str): A string to be checked.
+    Returns:
+        bool: True if the string is a valid Roman numeral, False otherwise.
+    """
+    return ROMAN_PATTERN.fullmatch(value) is not None
@@ -0,0 +1,304 @@
+import json
+import logging
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api import log
+from api.cache import LRUCache
+from api.log import JsonFormatter, SamplingFilter, Truncated
+from api.main import MAX_BATCH_SIZE, MAX_STREAM_LINE_LENGTH, app
+from api.metrics import Counter, Histogram
+from api.responses import dumps, prebuild
+from roman_numerals_converter.extended import to_extended_roman
+
+
+@pytest.fixture
+def client() -> TestClient:
+    return TestClient(app)
+
+
+def test_to_roman_endpoint(client: TestClient) -> None:
+    response = client.get("/to-roman/1994")
+    assert response.status_code == 200
+    assert response.json() == {"result": "MCMXCIV"}
+    assert client.get("/to-roman/4000").status_code == 400
+
+
+def test_from_roman_endpoint(client: TestClient) -> None:
+    response = client.get("/from-roman/MCMXCIV")
+    assert response.status_code == 200
+    assert response.json() == {"result": 1994}
+    assert client.get("/from-roman/IIII").status_code == 400
+
+
+def test_replace_endpoints(client: TestClient) -> None:
+    response = client.get("/replace-roman", params={"text": "Rocky II."})
+    assert response.json() == {"result": "Rocky 2."}
+    response = client.get("/replace-integers", params={"text": "Apollo 13"})
+    assert response.json() == {"result": "Apollo XIII"}
+
+
+def test_random_roman_endpoint(client: TestClient) -> None:
+    response = client.get("/random-roman/", params={"min_value": 5, "max_value": 5})
+    assert response.json() == {"result": "V", "min": 5, "max": 5, "random": 5}
+    response = client.get("/random-roman/", params={"min_value": 0})
+    assert response.status_code == 400
+
+
+def test_to_roman_batch_endpoint(client: TestClient) -> None:
+    response = client.post("/to-roman/batch", json={"numbers": [1, 4000, 1994]})
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert results[0] == {"result": "I"}
+    assert "error" in results[1]
+    assert results[2] == {"result": "MCMXCIV"}
+
+
+def test_from_roman_batch_endpoint(client: TestClient) -> None:
+    response = client.post("/from-roman/batch", json={"romans": ["I", "IIII", "X"]})
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert results[0] == {"result": 1}
+    assert "error" in results[1]
+    assert results[2] == {"result": 10}
+
+
+def test_batch_endpoint_item_types(client: TestClient) -> None:
+    # Items of the wrong type get an error each instead of failing the batch
+    response = client.post("/to-roman/batch", json={"numbers": [1, "abc", None, True]})
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert results[0] == {"result": "I"}
+    assert all("integer" in result["error"] for result in results[1:])
+
+    response = client.post("/from-roman/batch", json={"romans": ["X", 5, None]})
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert results[0] == {"result": 10}
+    assert all("error" in result for result in results[1:])
+
+
+def test_batch_endpoint_too_large(client: TestClient) -> None:
+    numbers = [1] * (MAX_BATCH_SIZE + 1)
+    response = client.post("/to-roman/batch", json={"numbers": numbers})
+    assert response.status_code == 422
+
+
+def test_stream_convert_endpoint(client: TestClient) -> None:
+    body = b'1994\n"MCMXCIV"\nXLII\n4000\n\nnot roman\n{}\n'
+    body += b"1" * (MAX_STREAM_LINE_LENGTH + 10) + b"\n7"
+    response = client.post("/stream/convert", content=body)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    results = [json.loads(line) for line in response.text.splitlines()]
+    assert results[:3] == [
+        {"result": "MCMXCIV"},
+        {"result": 1994},
+        {"result": 42},
+    ]
+    assert "error" in results[3]
+    assert "error" in results[4]
+    assert "error" in results[5]
+    assert "longer" in results[6]["error"]
+    assert results[7] == {"result": "VII"}
+    assert len(results) == 8
+
+
+def test_websocket_endpoint(client: TestClient) -> None:
+    messages = [
+        {"id": 1, "type": "to-roman", "value": 1994},
+        {"id": 2, "type": "from-roman", "value": "MCMXCIV"},
+        {"id": 3, "type": "replace-roman", "value": "Rocky II"},
+        {"id": 4, "type": "replace-integers", "value": "Apollo 13"},
+        {"id": 5, "type": "to-roman", "value": 4000},
+        {"id": 6, "type": "sideways", "value": 1},
+        {"id": 7, "type": "replace-roman", "value": 7},
+    ]
+    with client.websocket_connect("/ws") as websocket:
+        # Pipeline all messages before reading the answers
+        for message in messages:
+            websocket.send_json(message)
+        answers = [websocket.receive_json() for _ in messages]
+        websocket.send_text("not json")
+        assert websocket.receive_json() == {"id": None, "error": "Invalid JSON"}
+        websocket.send_json([1, 2])
+        assert "error" in websocket.receive_json()
+        websocket.send_json({"id": 8, "type": "to-roman", "value": True})
+        assert websocket.receive_json() == {
+            "id": 8,
+            "error": "Error converting to Roman: Number must be an integer.",
+        }
+
+    assert [answer["id"] for answer in answers] == list(range(1, 8))
+    assert [answer.get("result") for answer in answers[:4]] == [
+        "MCMXCIV",
+        1994,
+        "Rocky 2",
+        "Apollo XIII",
+    ]
+    assert all("error" in answer for answer in answers[4:])
+
+
+def test_log_truncated() -> None:
+    assert str(Truncated("short", 10)) == "short"
+    assert str(Truncated("x" * 50, 10)) == "xxxxxxxxxx... (50 characters)"
+
+
+def test_log_sampling_filter() -> None:
+    info = logging.LogRecord("api", logging.INFO, "", 0, "message", None, None)
+    error = logging.LogRecord("api", logging.ERROR, "", 0, "message", None, None)
+    assert not SamplingFilter(0.0).filter(info)
+    assert SamplingFilter(0.0).filter(error)
+    assert SamplingFilter(1.0).filter(info)
+
+
+def test_log_json_formatter() -> None:
+    record = logging.LogRecord("api", logging.INFO, "", 0, "Result: %s", ("X",), None)
+    entry = json.loads(JsonFormatter().format(record))
+    assert entry["level"] == "INFO"
+    assert entry["message"] == "Result: X"
+
+
+def test_logging_started_by_lifespan() -> None:
+    api_logger = logging.getLogger("api")
+    # Importing the app starts no thread and leaves the logger alone
+    assert log._listener is None and api_logger.propagate
+    with TestClient(app) as client:
+        assert log._listener is not None and not api_logger.propagate
+        assert client.get("/to-roman/1").status_code == 200
+    assert log._listener is None and api_logger.propagate
+    assert not api_logger.handlers
+
+
+def test_lru_cache() -> None:
+    cache: LRUCache[str] = LRUCache(capacity=2, max_key_size=5, enabled=True)
+    assert cache.get_or_compute("a", str.upper) == "A"
+    assert cache.get_or_compute("a", str.upper) == "A"
+    cache.get_or_compute("b", str.upper)
+    cache.get_or_compute("c", str.upper)
+    assert cache.get_or_compute("too long", str.upper) == "TOO LONG"
+    assert cache.stats() == {
+        "hits": 1,
+        "misses": 3,
+        "evictions": 1,
+        "size": 2,
+        "capacity": 2,
+    }
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.stats()["hits"] == 0
+
+    disabled: LRUCache[str] = LRUCache(capacity=2, enabled=False)
+    disabled.get_or_compute("a", str.upper)
+    assert len(disabled) == 0
+
+
+def test_replace_endpoint_cache(client: TestClient) -> None:
+    response = client.get("/replace-roman", params={"text": "Chapter XLII"})
+    assert response.json() == {"result": "Chapter 42"}
+    assert response.headers["cache-control"].startswith("public")
+    etag = response.headers["etag"]
+
+    response = client.get(
+        "/replace-roman",
+        params={"text": "Chapter XLII"},
+        headers={"If-None-Match": etag},
+    )
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+
+    stats = client.get("/cache-stats").json()["replace-roman"]
+    assert stats["hits"] >= 1
+    assert stats["misses"] >= 1
+
+
+def test_metrics_endpoint(client: TestClient) -> None:
+    client.get("/to-roman/12")
+    client.get("/to-roman/4000")
+    client.post("/to-roman/batch", json={"numbers": [1, 2]})
+    client.get("/does-not-exist")
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    text = response.text
+    assert "# TYPE roman_api_request_duration_seconds histogram" in text
+    assert (
+        'roman_api_requests_total{route="/to-roman/{number}",method="GET",status="200"}'
+        in text
+    )
+    assert 'status="400"' in text
+    assert 'route="unmatched"' in text
+    assert 'roman_api_request_size_bytes_bucket{route="/to-roman/batch"' in text
+    assert "roman_api_requests_in_flight 1" in text
+
+
+def test_metrics_histogram() -> None:
+    histogram = Histogram("latency", "Latency.", ("route",), (0.1, 1.0))
+    for value in (0.05, 0.5, 5.0):
+        histogram.observe(("/a",), value)
+    assert list(histogram.samples()) == [
+        'latency_bucket{route="/a",le="0.1"} 1',
+        'latency_bucket{route="/a",le="1"} 2',
+        'latency_bucket{route="/a",le="+Inf"} 3',
+        'latency_sum{route="/a"} 5.55',
+        'latency_count{route="/a"} 3',
+    ]
+
+    counter = Counter("errors", "Errors.", ("route",))
+    counter.inc(('say "hi"',))
+    assert list(counter.samples()) == ['errors{route="say \\"hi\\""} 1']
+
+    # Large counters and sums are rendered exactly
+    counter.inc(('say "hi"',), 1_234_566)
+    assert list(counter.samples())[0].endswith(" 1234567")
+    histogram.observe(("/a",), 1_000_000.25)
+    assert 'latency_sum{route="/a"} 1000005.8' in list(histogram.samples())
+
+
+@pytest.mark.parametrize("has_orjson", [True, False])
+def test_dumps(monkeypatch: pytest.MonkeyPatch, has_orjson: bool) -> None:
+    monkeypatch.setattr("api.responses.HAS_ORJSON", has_orjson)
+    content = {"result": "MCMXCIV", "values": [1, None, True], "text": "ü"}
+    assert dumps(content) == json.dumps(
+        content, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+    assert dumps({"result": 10**20}) == b'{"result":100000000000000000000}'
+
+
+def test_prebuilt_responses(client: TestClient) -> None:
+    response = client.get("/to-roman/1994")
+    assert response.content == b'{"result":"MCMXCIV"}'
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["etag"] == prebuild({"result": "MCMXCIV"}).etag
+    assert client.get("/from-roman/MCMXCIV").content == b'{"result":1994}'
+
+    schemas = client.get("/openapi.json").json()["components"]["schemas"]
+    assert schemas["RomanResult"]["properties"]["result"]["type"] == "string"
+    assert "BatchResponse" in schemas
+
+
+def test_extended_endpoints(client: TestClient) -> None:
+    response = client.get("/to-roman/4000", params={"extended": True})
+    assert response.json() == {"result": "I\u0305V\u0305"}
+    assert "etag" in response.headers
+    response = client.get("/to-roman/12", params={"extended": True})
+    assert response.json() == {"result": "XII"}
+    response = client.get("/from-roman/I\u0305V\u0305", params={"extended": True})
+    assert response.json() == {"result": 4000}
+    assert client.get("/from-roman/I\u0305V\u0305").status_code == 400
+
+    # Values above 2**64 do not fit the integers of orjson
+    roman = to_extended_roman(10**20)
+    response = client.get(f"/from-roman/{roman}", params={"extended": True})
+    assert response.json() == {"result": 10**20}
+    response = client.get(f"/to-roman/{10**20}", params={"extended": True})
+    assert response.json() == {"result": roman}
+
+
+def test_extended_length_limit(client: TestClient) -> None:
+    response = client.get("/to-roman/1000000000000000000", params={"extended": True})
+    assert response.json() == {"result": "M" + "\u0305" * 5}
+    response = client.get(f"/to-roman/{10**4000}", params={"extended": True})
+    assert response.status_code == 400
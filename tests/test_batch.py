@@ -0,0 +1,73 @@
+import io
+
+import pytest
+
+from roman_numerals_converter import convert_to_roman
+from roman_numerals_converter.batch import (
+    INVALID_MARKER,
+    convert_lines,
+    from_roman_array,
+    read_line_blocks,
+    to_roman_array,
+)
+
+
+def test_to_roman_array_fallback() -> None:
+    result = to_roman_array([1, 1994, 0, 4000, 1.5, "X"], use_numpy=False)
+    assert result.values == ["I", "MCMXCIV", "", "", "", ""]
+    assert result.valid == [True, True, False, False, False, False]
+
+
+def test_from_roman_array_fallback() -> None:
+    result = from_roman_array(["I", "MCMXCIV", "IIII", "", 10], use_numpy=False)
+    assert result.values == [1, 1994, 0, 0, 0]
+    assert result.valid == [True, True, False, False, False]
+
+
+def test_to_roman_array_numpy() -> None:
+    np = pytest.importorskip("numpy")
+    numbers = np.arange(-5, 4005).reshape(10, 401)
+    result = to_roman_array(numbers)
+    assert result.values.shape == numbers.shape
+    assert result.valid.sum() == 3999
+    expected = [
+        convert_to_roman(number) if 1 <= number <= 3999 else ""
+        for number in numbers.ravel().tolist()
+    ]
+    assert result.values.ravel().tolist() == expected
+
+    assert to_roman_array(n for n in [3, 10**30]).values.tolist() == ["III", ""]
+    assert not to_roman_array(np.array([1.0, 2.0])).valid.any()
+
+
+def test_from_roman_array_numpy() -> None:
+    np = pytest.importorskip("numpy")
+    result = from_roman_array(np.array([["X", "IIII"], ["MCMXCIV", "X"]]))
+    assert result.values.tolist() == [[10, 0], [1994, 10]]
+    assert result.valid.tolist() == [[True, False], [True, True]]
+
+    result = from_roman_array(["X", None, 5])
+    assert result.values.tolist() == [10, 0, 0]
+    assert result.valid.tolist() == [True, False, False]
+
+
+def test_convert_lines() -> None:
+    lines = ["1\n", " 1994 \n", "0\n", "abc\n", "", "9" * 100]
+    assert convert_lines(lines, "to-roman", "skip") == (["I", "MCMXCIV"], 4)
+    converted, invalid = convert_lines(lines, "to-roman", "mark")
+    assert converted == ["I", "MCMXCIV"] + [INVALID_MARKER] * 4
+    assert convert_lines(["X\n", "IIII\n"], "from-roman", "skip") == (["10"], 1)
+
+    with pytest.raises(ValueError, match="line 12"):
+        convert_lines(["X\n", "IIII\n"], "from-roman", "fail", first_line=11)
+    with pytest.raises(ValueError):
+        convert_lines([], "sideways")
+    with pytest.raises(ValueError):
+        convert_lines([], "to-roman", "ignore")
+
+
+def test_read_line_blocks() -> None:
+    text = "".join(f"{number}\n" for number in range(1000))
+    blocks = list(read_line_blocks(io.StringIO(text), block_size=100))
+    assert len(blocks) > 1
+    assert "".join(line for block in blocks for line in block) == text
@@ -75,3 +75,94 @@ def test_equivalence(runner: CliRunner):
         result = runner.invoke(cli, ["from-roman", roman])
         assert result.exit_code == 0
         assert result.output.strip() == str(number)
+
+
+def test_replace_roman(runner: CliRunner):
+    # Test streaming replacement of Roman numerals read from stdin
+    result = runner.invoke(
+        cli, ["replace-roman"], input="In MMXVIII, on VII of June.\nRocky II.\n"
+    )
+    assert result.exit_code == 0
+    assert result.output == "In 2018, on 7 of June.\nRocky 2.\n"
+
+
+def test_replace_integers(runner: CliRunner):
+    # Test streaming replacement of integers read from stdin
+    result = runner.invoke(cli, ["replace-integers"], input="Apollo 13 in 1969\n")
+    assert result.exit_code == 0
+    assert result.output == "Apollo XIII in MCMLXIX\n"
+
+    # Integers without a Roman numeral are left unchanged
+    result = runner.invoke(cli, ["replace-integers"], input="v2.0 of 10000\n")
+    assert result.exit_code == 0
+    assert result.output == "v2.0 of 10000\n"
+
+
+def test_batch(runner: CliRunner):
+    # Test bulk conversion of newline-delimited values
+    result = runner.invoke(cli, ["batch", "to-roman", "--quiet"], input="1\n1994\n")
+    assert result.exit_code == 0
+    assert result.output == "I\nMCMXCIV\n"
+
+    result = runner.invoke(cli, ["batch", "from-roman"], input="I\nMCMXCIV\n")
+    assert result.exit_code == 0
+    assert "1\n1994\n" in result.output
+    assert "Converted 2 of 2 lines" in result.output
+
+
+def test_batch_invalid_lines(runner: CliRunner):
+    # Test the handling of invalid lines
+    values = "I\nabc\nX\n"
+    options = ["batch", "from-roman", "--quiet", "--on-error"]
+    result = runner.invoke(cli, [*options, "skip"], input=values)
+    assert result.output == "1\n10\n"
+    result = runner.invoke(cli, [*options, "mark"], input=values)
+    assert result.output == "1\n#INVALID\n10\n"
+    result = runner.invoke(cli, [*options, "fail"], input=values)
+    assert result.exit_code != 0
+    assert "line 2" in result.output
+
+
+def test_batch_workers(runner: CliRunner):
+    # Test that parallel batch conversion preserves the order of the lines
+    values = "".join(f"{number}\n" for number in range(1, 4000))
+    result = runner.invoke(
+        cli, ["batch", "to-roman", "--quiet", "--workers", "2"], input=values
+    )
+    assert result.exit_code == 0
+    assert result.output.splitlines()[-1] == "MMMCMXCIX"
+    assert len(result.output.splitlines()) == 3999
+
+
+def test_client(runner: CliRunner, tmp_path):
+    # Without a daemon the values are converted in-process
+    socket_path = str(tmp_path / "missing.sock")
+    result = runner.invoke(
+        cli, ["client", "to-roman", "4", "9", "--socket", socket_path]
+    )
+    assert result.exit_code == 0
+    assert result.output == "IV\nIX\n"
+
+    result = runner.invoke(
+        cli, ["client", "from-roman", "--socket", socket_path], input="X\nbad\n"
+    )
+    assert result.exit_code == 0
+    assert result.output == "10\n#INVALID\n"
+
+
+def test_extended(runner: CliRunner):
+    result = runner.invoke(cli, ["to-roman", "--extended", "1994000"])
+    assert result.exit_code == 0
+    assert result.output.strip() == "M\u0305C\u0305M\u0305X\u0305C\u0305I\u0305V\u0305"
+    result = runner.invoke(cli, ["from-roman", "--extended", "X\u0305I"])
+    assert result.exit_code == 0
+    assert result.output.strip() == "10001"
+
+    assert runner.invoke(cli, ["to-roman", "--extended", "0"]).exit_code != 0
+    assert runner.invoke(cli, ["from-roman", "--extended", "MMMM"]).exit_code != 0
+
+
+def test_extended_max_length(runner: CliRunner):
+    result = runner.invoke(cli, ["to-roman", "--extended", "--max-length", "3", "4000"])
+    assert result.exit_code != 0
+    assert "longer than 3 characters" in result.output
@@ -1,3 +1,5 @@
+import io
+
 import pytest
 
 from roman_numerals_converter import (
@@ -6,7 +8,12 @@ from roman_numerals_converter import (
     random_roman,
     replace_roman_numerals_with_integers_in_text,
 )
-from roman_numerals_converter.converter import replace_integers_with_roman_numerals
+from roman_numerals_converter.converter import (
+    iter_replace_integers_with_roman_numerals,
+    iter_replace_roman_numerals_with_integers,
+    replace_integers_with_roman_numerals,
+    replace_valid_integers_with_roman_numerals,
+)
 
 
 # Tests for convert_to_roman
@@ -35,6 +42,18 @@ def test_convert_from_roman_invalid():
         convert_from_roman("MMMM")
 
 
+def test_convert_extended():
+    assert convert_to_roman(4000, extended=True) == "I\u0305V\u0305"
+    assert convert_from_roman("I\u0305V\u0305", extended=True) == 4000
+    assert convert_from_roman("XIV", extended=True) == 14
+    with pytest.raises(ValueError):
+        convert_to_roman(0, extended=True)
+    with pytest.raises(ValueError):
+        convert_from_roman("I\u0305V\u0305")
+    with pytest.raises(ValueError):
+        convert_from_roman("MMMM", extended=True)
+
+
 # Tests for replace_roman_numerals_in_text
 def test_replace_roman_numerals_in_text():
     assert (
@@ -57,6 +76,21 @@ def test_replace_roman_numerals_in_text():
     )
 
 
+def test_replace_roman_numerals_in_text_whole_words_only():
+    # Test that only whole words are replaced, not substrings of other words
+    assert (
+        replace_roman_numerals_with_integers_in_text("Chapters VI and VII")
+        == "Chapters 6 and 7"
+    )
+    assert (
+        replace_roman_numerals_with_integers_in_text("Louis XIV's X-ray (X)")
+        == "Louis XIV's X-ray (10)"
+    )
+    assert replace_roman_numerals_with_integers_in_text("IIII, MCMXCIV") == (
+        "IIII, 1994"
+    )
+
+
 def test_replace_integers_with_roman_numerals():
     assert (
         replace_integers_with_roman_numerals("The year 2020 was challenging.")
@@ -68,6 +102,42 @@ def test_replace_integers_with_roman_numerals():
     )
 
 
+# Tests for the streaming replacements
+def test_iter_replace_split_tokens():
+    text = "In MMXVIII, the event (X) took place on VII of June 2020.\nApollo 13\n"
+    for size in range(1, len(text) + 1):
+        chunks = [text[i : i + size] for i in range(0, len(text), size)]
+        assert "".join(iter_replace_roman_numerals_with_integers(chunks)) == (
+            replace_roman_numerals_with_integers_in_text(text)
+        )
+        assert "".join(iter_replace_integers_with_roman_numerals(chunks)) == (
+            replace_integers_with_roman_numerals(text)
+        )
+
+
+def test_iter_replace_integers_out_of_range():
+    # One integer without a Roman numeral does not abort the whole stream
+    chunks = ["v2.0 of 10", "000, 0 and 3999", "9, 7\n"]
+    converted = iter_replace_integers_with_roman_numerals(chunks)
+    assert "".join(converted) == "v2.0 of 10000, 0 and 39999, VII\n"
+    assert replace_valid_integers_with_roman_numerals("4 4000") == "IV 4000"
+    with pytest.raises(ValueError):
+        replace_integers_with_roman_numerals("4000")
+
+
+def test_iter_replace_file_object():
+    text = "VII " * 50_000
+    converted = iter_replace_roman_numerals_with_integers(io.StringIO(text))
+    assert "".join(converted) == "7 " * 50_000
+
+
+def test_iter_replace_long_token():
+    # Tokens longer than the limit are passed through unchanged
+    chunks = ["aaaaa", "bbbbb", "X X", " X"]
+    converted = iter_replace_roman_numerals_with_integers(chunks, max_token_length=6)
+    assert "".join(converted) == "aaaaabbbbbX 10 10"
+
+
 # Tests for random_roman
 def test_random_roman_valid():
     roman, number = random_roman()
@@ -0,0 +1,116 @@
+import os
+import socket
+import threading
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from roman_numerals_converter.daemon import (
+    HAS_UNIX_SOCKETS,
+    INVALID_MARKER,
+    MAX_REQUEST_LENGTH,
+    DaemonClient,
+    default_socket_path,
+    handle_request,
+    iter_convert,
+    make_server,
+    run_server,
+)
+
+unix_sockets = pytest.mark.skipif(
+    not HAS_UNIX_SOCKETS, reason="Unix domain sockets are not supported"
+)
+
+
+@pytest.fixture
+def socket_path(tmp_path: Path) -> Iterator[str]:
+    path = str(tmp_path / "roman.sock")
+    server = make_server(path)
+    thread = threading.Thread(target=run_server, args=(server,))
+    thread.start()
+    yield path
+    server.shutdown()
+    thread.join()
+
+
+def test_handle_request() -> None:
+    assert handle_request("to-roman 1 4000 1994\n") == f"I {INVALID_MARKER} MCMXCIV"
+    assert handle_request("from-roman XIV iv") == f"14 {INVALID_MARKER}"
+    assert handle_request("to-roman") == ""
+    assert handle_request("").startswith("#ERROR")
+    assert handle_request("sideways 1").startswith("#ERROR")
+
+
+@unix_sockets
+def test_client_batches(socket_path: str) -> None:
+    with DaemonClient(socket_path) as client:
+        assert client.convert("to-roman", ["1", " 2 ", "", "x y", "3999"]) == [
+            "I",
+            "II",
+            INVALID_MARKER,
+            INVALID_MARKER,
+            "MMMCMXCIX",
+        ]
+        assert client.convert("from-roman", ["MMXXIV"]) == ["2024"]
+        assert client.convert("from-roman", []) == []
+        with pytest.raises(ValueError, match="Unknown direction"):
+            client.convert("sideways", ["1"])
+
+
+@unix_sockets
+def test_request_too_long(socket_path: str) -> None:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(socket_path)
+        connection.sendall(b"to-roman " + b"1" * MAX_REQUEST_LENGTH)
+        assert connection.makefile("rb").readline().startswith(b"#ERROR")
+
+
+@unix_sockets
+def test_second_daemon_refused(socket_path: str) -> None:
+    with pytest.raises(RuntimeError, match="already listening"):
+        make_server(socket_path)
+
+
+@unix_sockets
+def test_stale_socket_removed(tmp_path: Path) -> None:
+    path = str(tmp_path / "stale.sock")
+    Path(path).touch()
+    make_server(path).server_close()
+
+
+@unix_sockets
+def test_iter_convert_uses_daemon(socket_path: str) -> None:
+    blocks = [["1", "2"], ["3"]]
+    assert list(iter_convert("to-roman", blocks, socket_path)) == [["I", "II"], ["III"]]
+
+
+def test_iter_convert_fallback(tmp_path: Path) -> None:
+    missing = str(tmp_path / "missing.sock")
+    blocks = [["X", "bad"]]
+    assert list(iter_convert("from-roman", blocks, missing)) == [["10", INVALID_MARKER]]
+
+
+def test_default_socket_path(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.delenv("ROMAN_NUMERALS_SOCKET", raising=False)
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    assert default_socket_path() == str(tmp_path / "roman-numerals.sock")
+    monkeypatch.delenv("XDG_RUNTIME_DIR")
+    assert default_socket_path().endswith(".sock")
+    monkeypatch.setenv("ROMAN_NUMERALS_SOCKET", "/run/custom.sock")
+    assert default_socket_path() == "/run/custom.sock"
+
+
+@unix_sockets
+def test_socket_of_other_user_refused(
+    socket_path: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Pretend the daemon's socket was created by someone else
+    uid = os.getuid()
+    monkeypatch.setattr(os, "getuid", lambda: uid + 1)
+    with pytest.raises(PermissionError, match="another user"):
+        DaemonClient(socket_path)
+    with pytest.raises(RuntimeError, match="another user"):
+        make_server(socket_path)
+    # The client converts in process instead of trusting the socket
+    assert list(iter_convert("to-roman", [["4"]], socket_path)) == [["IV"]]
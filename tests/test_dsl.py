@@ -0,0 +1,513 @@
+import io
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Optional
+
+import pytest
+
+from DSL.DSL import DSLInterpreter, main
+from DSL.dsl_array import ArrayValue, RangeLiteral, load_array, parse_range
+from DSL.dsl_command import Command, CommandError
+from DSL.dsl_compiler import (
+    ADD,
+    CONSTANT,
+    FAIL,
+    RANGE,
+    SET,
+    Program,
+    compile_operand,
+    compile_program,
+    compile_statement,
+    optimize_program,
+)
+from DSL.dsl_handlers import ArithmeticHandler, AssignmentHandler
+from DSL.dsl_parser import Parser
+from DSL.dsl_script import ScriptError, iter_statements, run_script
+from DSL.dsl_variable import DEFINED, ROMAN, SYMBOLS, Variable, VariableStore
+from roman_numerals_converter import RomanNumeral
+
+
+@pytest.fixture
+def interpreter() -> DSLInterpreter:
+    return DSLInterpreter()
+
+
+def test_execute(interpreter: DSLInterpreter) -> None:
+    results = interpreter.execute("set a = X; set b 5; add a b; convert XV; display a")
+    assert results == [RomanNumeral("XV"), 15, "X"]
+
+
+def test_arithmetic(interpreter: DSLInterpreter) -> None:
+    interpreter.execute("set a = XII")
+    results = interpreter.execute(
+        "subtract a 2; multiply a II; divide a 4; add 3 a; divide 6 a"
+    )
+    assert results == ["X", "XXIV", "III", 15, 0.5]
+    assert interpreter.execute("add a 3 c; display c") == ["XV"]
+    assert interpreter.execute("convert 1994") == ["MCMXCIV"]
+
+
+def test_errors_are_reported(
+    interpreter: DSLInterpreter, capsys: pytest.CaptureFixture[str]
+) -> None:
+    results = interpreter.execute(
+        "jump a; add a; add missing 1; set IV = 4; multiply MM II; convert 0; display X"
+    )
+    assert results == ["X"]
+    errors = capsys.readouterr().out.splitlines()
+    assert len(errors) == 6
+    assert errors[0].startswith("Error in command 'jump a'")
+    assert "Invalid value 'missing'" in errors[2]
+    assert "cannot be a Roman numeral" in errors[3]
+
+
+def test_compile_program() -> None:
+    program = compile_program("set a = X; ; add a 5;", optimize=False)
+    assert len(program) == 2
+    opcode, first, _, target, _ = program.instructions[0]
+    assert (opcode, first, target) == (
+        SET,
+        (False, RomanNumeral("X")),
+        SYMBOLS.slot("a"),
+    )
+    opcode, first, second, target, _ = program.instructions[1]
+    a = (True, SYMBOLS.slot("a"))
+    assert (opcode, first, second, target) == (ADD, a, (False, 5), None)
+    assert compile_program("add a b c d").instructions[0].opcode == FAIL
+
+
+def test_compile_cache() -> None:
+    source = "set a 1; add a a"
+    assert compile_program(source) is compile_program(source)
+
+    # A cached program runs independently against different stores
+    first, second = VariableStore(), VariableStore()
+    assert compile_program(source).run(first) == [2]
+    second.set_variable("b", 7)
+    assert compile_program(source).run(second) == [2]
+    assert "b" in second
+
+
+def test_run_raises_without_handler() -> None:
+    with pytest.raises(ValueError, match="Invalid value 'a'"):
+        compile_program("display a").run(VariableStore())
+
+
+def test_constant_folding() -> None:
+    program = compile_program("add X 5; multiply IV 10 a; convert XIV; display 7")
+    assert [instruction.opcode for instruction in program.instructions] == [
+        CONSTANT,
+        SET,
+        CONSTANT,
+        CONSTANT,
+    ]
+    assert [instruction.first[1] for instruction in program.instructions] == [
+        RomanNumeral("XV"),
+        RomanNumeral("XL"),
+        14,
+        "7",
+    ]
+
+    # Failing and variable expressions are left to the run
+    program = compile_program(
+        "subtract I V; divide 1 0; convert 0; add a 1; add 1 2 IV"
+    )
+    assert all(instruction.opcode != CONSTANT for instruction in program.instructions)
+
+
+def test_dead_store_elimination() -> None:
+    program = compile_program("set a 1; set a 2; set b 3; add 1 2 b; display a")
+    assert [instruction.statement for instruction in program.instructions] == [
+        "set a 2",
+        "add 1 2 b",
+        "display a",
+    ]
+    assert program.positions == (1, 3, 4)
+
+    # The first store of a is kept so that a is still defined before b
+    program = compile_program("set a 1; set b 2; set a 3; set b 4; set a 5")
+    assert [instruction.statement for instruction in program.instructions] == [
+        "set a 1",
+        "set b 4",
+        "set a 5",
+    ]
+
+    # Stores read, or followed by a statement that can fail, are kept
+    for source in ("set a 1; add a 1; set a 2", "set a 1; display b; set a 2"):
+        assert len(compile_program(source)) == 3
+    assert len(compile_program("set a 1; set a b")) == 2
+
+
+PROGRAMS = [
+    "set a = X; set b 5; add a b; convert XV; display a",
+    "set a 1; set a 2; set b a; set a 3; display b; display a",
+    "add X 5; multiply IV 10 c; convert XIV; divide X 4; display c",
+    "set a 1; add 2 2 a; set a V; subtract a I a; display a",
+    "set a 1; jump a; set a 2; add a; set a 3",
+    "set a 1; display missing; set a 2; convert 0; set a 3; set IV 2",
+    "set a 1; add 1 2 IV; set a 2; subtract I V; set a 3; divide 1 0 a; set a 4",
+    "set x 3999; add x 1; set x MMMCMXCIX; add x 1; set x 1",
+    "set r 1..3; set r I..III; add r 1; multiply 2 r r; convert r; display r",
+    "set a 1; set b 2; set a 3",
+    "set a 1; set b 2; set a 3; set c 4; set b 5; set a 6; set c 7",
+]
+
+
+@pytest.mark.parametrize("source", PROGRAMS)
+def test_optimize_preserves_semantics(source: str) -> None:
+    def run(optimize: bool) -> tuple[list[Any], list[Any], list[tuple[str, Any]]]:
+        store = VariableStore()
+        errors: list[Any] = []
+        program = compile_program(source, optimize=optimize)
+        results = program.run(
+            store, lambda *error: errors.append((error[0], error[1], str(error[2])))
+        )
+        # A list, as the order in which the variables were defined must match too
+        values = list(zip(store.variable_names, store.variable_values))
+        return results, errors, values
+
+    assert run(optimize=True) == run(optimize=False)
+
+
+@pytest.mark.parametrize("source", PROGRAMS)
+def test_optimize_preserves_state_at_errors(source: str) -> None:
+    def run(optimize: bool) -> tuple[Optional[str], list[tuple[str, Any]]]:
+        store = VariableStore()
+        error = None
+        try:
+            compile_program(source, optimize=optimize).run(store)
+        except Exception as e:
+            error = str(e)
+        # A list, as the order in which the variables were defined must match too
+        values = list(zip(store.variable_names, store.variable_values))
+        return error, values
+
+    assert run(optimize=True) == run(optimize=False)
+
+
+def test_optimize_keeps_positions() -> None:
+    program = optimize_program(
+        Program(
+            compile_program("set a 1; set a 2; display b", optimize=False).instructions,
+            (5, 6, 7),
+        )
+    )
+    errors: list[int] = []
+    program.run(VariableStore(), lambda position, *_: errors.append(position))
+    assert program.positions == (6, 7)
+    assert errors == [7]
+
+
+def test_compile_operand() -> None:
+    assert compile_operand("XIV") == (False, RomanNumeral("XIV"))
+    assert compile_operand("14") == (False, 14)
+    assert compile_operand("x") == (True, SYMBOLS.slot("x"))
+    assert compile_operand("I..X") == (RANGE, RangeLiteral(1, 10, True))
+
+
+def test_ranges_built_at_run_time() -> None:
+    # Compiled and cached programs hold the ends of a range, not its array
+    program = compile_program("set big 1..1000000; add 1..3 1 small")
+    for instruction in program.instructions:
+        assert not isinstance(instruction.first[1], ArrayValue)
+    assert program.instructions[0].first == (RANGE, RangeLiteral(1, 1000000, False))
+
+    store = VariableStore()
+    program.run(store)
+    assert len(store.get_variable("big").value) == 1000000  # type: ignore
+    assert store.get_variable("small").value == ArrayValue([2, 3, 4])
+
+
+def test_variable_store() -> None:
+    store = VariableStore()
+    assert store.is_empty
+    store.set_variable("a", RomanNumeral("XIV"))
+    store.set_variable("b", 14)
+    store.set_variable("c", 0.5)
+    store.set_variable("a", RomanNumeral("XV"))
+    assert store.variable_names == ["a", "b", "c"]
+    assert store.variable_values == [RomanNumeral("XV"), 14, 0.5]
+    assert repr(store) == "a = XV\nb = 14\nc = 0.5"
+    assert "a" in store and "d" not in store
+
+    # Values are numbers, Roman numerals are told apart by a flag
+    a, b = SYMBOLS.slot("a"), SYMBOLS.slot("b")
+    assert (store.values[a], store.values[b]) == (15, 14)
+    assert (store.flags[a], store.flags[b]) == (DEFINED | ROMAN, DEFINED)
+    assert store.get_variable("a").type is RomanNumeral
+
+    with pytest.raises(ValueError, match="cannot be a Roman numeral"):
+        store.set_variable("IV", 4)
+    with pytest.raises(ValueError, match="not found"):
+        store.get_variable("d")
+
+
+def test_names_validated_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+    valid_name = Variable.valid_name
+
+    def counting_valid_name(name: str) -> bool:
+        calls.append(name)
+        return valid_name(name)
+
+    monkeypatch.setattr(Variable, "valid_name", counting_valid_name)
+    program = compile_program(
+        "set validated 1; add validated 1 validated; add validated 1 validated"
+    )
+    first, second = VariableStore(), VariableStore()
+    for _ in range(3):
+        program.run(first)
+        program.run(second)
+    assert first.get_variable("validated").value == 3
+    assert calls == ["validated"]
+
+
+def test_store_grows_with_symbols() -> None:
+    store = VariableStore()
+    compile_program("set early 1").run(store)
+    # A name seen after the store was created gets a slot beyond its arrays
+    compile_program("set late_name 2; add early late_name").run(store)
+    assert store.variable_names == ["early", "late_name"]
+    assert "late_name" not in VariableStore()
+
+
+def test_store_sized_by_program(monkeypatch: pytest.MonkeyPatch) -> None:
+    program = compile_program("set sized 1; add sized 1 total")
+    assert program.size == SYMBOLS.slot("total") + 1
+    for index in range(100):
+        SYMBOLS.slot(f"unused_{index}")
+
+    # A store only grows to the highest slot it is used with, not all of SYMBOLS
+    store = VariableStore()
+    program.run(store)
+    assert len(store.values) == len(store.flags) == program.size
+    assert len(store.flags) <= len(SYMBOLS) - 100
+
+    monkeypatch.setattr("DSL.dsl_variable.MAX_SYMBOLS", len(SYMBOLS))
+    with pytest.raises(ValueError, match="distinct names"):
+        store.set_variable("one_name_too_many", 1)
+    assert compile_statement("set one_name_too_many 1").opcode == FAIL
+    store.set_variable("sized", 2)
+
+
+def test_symbols_from_threads() -> None:
+    names = [f"threaded_{index}" for index in range(2000)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: list(map(SYMBOLS.slot, names)), range(8)))
+    # Every thread sees the same slot for a name and no name is added twice
+    assert all(slots == results[0] for slots in results)
+    assert [SYMBOLS.names[slot] for slot in results[0]] == names
+    assert len(set(SYMBOLS.names)) == len(SYMBOLS)
+
+    # A statement that fails to compile does not add its target
+    assert compile_statement("add 1 1..X never_assigned").opcode == FAIL
+    assert "never_assigned" not in SYMBOLS.slots
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "lists"])
+def use_numpy(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> bool:
+    if request.param:
+        pytest.importorskip("numpy")
+    monkeypatch.setattr("DSL.dsl_array.HAS_NUMPY", request.param)
+    return bool(request.param)
+
+
+def test_parse_range(use_numpy: bool) -> None:
+    literal = parse_range("3..6")
+    assert literal == RangeLiteral(3, 6, False)
+    array = literal.build()
+    assert (array.tolist(), array.roman) == ([3, 4, 5, 6], False)
+    assert isinstance(array.numbers, list) is not use_numpy
+    assert parse_range("V..III") == RangeLiteral(5, 3, True)
+    assert RangeLiteral(5, 3, True).build() == ArrayValue([], roman=True)
+    assert parse_range("5") is None
+    with pytest.raises(ValueError, match="both ends"):
+        parse_range("1..X")
+    with pytest.raises(ValueError, match="longer than"):
+        parse_range("1..99999999")
+
+
+def test_array_arithmetic(use_numpy: bool) -> None:
+    romans, numbers = ArrayValue([1, 2, 3], roman=True), ArrayValue([4, 6, 8])
+    assert (romans + numbers).tolist() == [
+        RomanNumeral(value) for value in ("V", "VIII", "XI")
+    ]
+    assert (numbers - romans).tolist() == [3, 4, 5]
+    assert (numbers * RomanNumeral("II")).roman
+    assert (10 - romans).tolist() == [9, 8, 7]
+    assert (RomanNumeral("X") * numbers).tolist()[0] == RomanNumeral("XL")
+    assert (numbers / 4).tolist() == [1.0, 1.5, 2.0]
+    assert (numbers.convert() / 4).tolist() == [RomanNumeral("I")] * 2 + [
+        RomanNumeral("II")
+    ]
+    assert (12 / romans).tolist() == [12.0, 6.0, 4.0]
+
+    with pytest.raises(ValueError, match="-1 at index 0"):
+        romans - 2
+    with pytest.raises(ZeroDivisionError):
+        numbers / ArrayValue([1, 0, 1])
+    with pytest.raises(ValueError, match="same length"):
+        romans + ArrayValue([1])
+    with pytest.raises(TypeError):
+        romans + "X"  # type: ignore
+
+
+def test_array_arithmetic_beyond_int64(use_numpy: bool) -> None:
+    # Results that do not fit 64 bits are exact, with or without NumPy
+    interpreter = DSLInterpreter()
+    results = interpreter.execute(
+        "set a = 3000000000..3000000002; multiply a a b; multiply b b c; display c"
+    )
+    assert results == ["\n".join(str(n**4) for n in range(3 * 10**9, 3 * 10**9 + 3))]
+    big = 2**63 - 1
+    assert (ArrayValue([big - 1, big]) + 1).tolist() == [big, big + 1]
+    assert (ArrayValue([-big]) - 2).tolist() == [-big - 2]
+    assert ArrayValue([2**64, 1]).tolist() == [2**64, 1]
+    assert parse_range(f"{big}..{big + 1}").build().tolist() == [big, big + 1]  # type: ignore
+
+
+def test_array_convert_and_display(use_numpy: bool) -> None:
+    romans = ArrayValue([1, 14, 3999]).convert()
+    assert str(romans) == "I\nXIV\nMMMCMXCIX"
+    assert str(romans.convert()) == "1\n14\n3999"
+    assert repr(romans) == "ArrayValue([1, 14, 3999], roman=True)"
+    with pytest.raises(ValueError, match="4000 at index 1"):
+        ArrayValue([1, 4000]).convert()
+    with pytest.raises(ValueError, match="0.5 at index 0"):
+        (ArrayValue([1]) / 2).convert()
+
+
+def test_load_array(use_numpy: bool, tmp_path: Path) -> None:
+    path = tmp_path / "values.txt"
+    path.write_text("XIV\n\n MCM \n")
+    assert load_array(str(path)) == ArrayValue([14, 1900], roman=True)
+    path.write_text("14\n1900\n")
+    assert load_array(str(path)) == ArrayValue([14, 1900])
+    path.write_text("1\n\nX\n")
+    with pytest.raises(ValueError, match="'X' on line 3"):
+        load_array(str(path))
+    path.write_text("I\n\nIIII\n")
+    with pytest.raises(ValueError, match="'IIII' on line 3"):
+        load_array(str(path))
+
+
+def test_array_statements(
+    use_numpy: bool, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    path = tmp_path / "column.txt"
+    path.write_text("1\n2\n3\n")
+    interpreter = DSLInterpreter()
+    results = interpreter.execute(
+        f"load a {path}; set b = I..III; add a b c; convert c; multiply c 2; display b"
+    )
+    assert [str(result) for result in results] == [
+        "II\nIV\nVI",
+        "4\n8\n12",
+        "I\nII\nIII",
+    ]
+    assert interpreter.store.get_variable("c").value == ArrayValue([2, 4, 6])
+
+    assert interpreter.execute(f"load d {tmp_path / 'missing.txt'}; set e 1..X") == []
+    errors = capsys.readouterr().out.splitlines()
+    assert "No such file" in errors[0]
+    assert "Invalid range '1..X'" in errors[1]
+
+
+def test_handlers() -> None:
+    store = VariableStore()
+    parser = Parser(store)
+    AssignmentHandler(store, parser).handle(Command("set a = X"))
+    arithmetic = ArithmeticHandler(store, parser)
+    assert arithmetic.handle(Command("add a V")) == RomanNumeral("XV")
+    assert arithmetic.handle(Command("add a V b")) is None
+    assert store.get_variable("b").value == RomanNumeral("XV")
+    with pytest.raises(CommandError):
+        Command("add")
+
+
+SCRIPT = """# Comments and blank lines are ignored
+set a = X  # ten
+add a 5; display a
+
+convert MMMM
+multiply a 3 b; display b
+"""
+
+
+def test_iter_statements() -> None:
+    statements = list(iter_statements(io.StringIO(SCRIPT)))
+    assert statements[0] == (2, "set a = X")
+    assert statements[1:3] == [(3, "add a 5"), (3, "display a")]
+    assert len(statements) == 6
+
+
+@pytest.mark.parametrize("block_size", [1, 2, 1000])
+def test_run_script(block_size: int) -> None:
+    output, errors = io.StringIO(), io.StringIO()
+    summary = run_script(
+        io.StringIO(SCRIPT), output, errors=errors, block_size=block_size
+    )
+    assert summary == (6, 1)
+    assert output.getvalue() == "XV\nX\nXXX\n"
+    assert errors.getvalue().startswith("Error on line 5 in 'convert MMMM'")
+
+
+def test_run_script_error_modes() -> None:
+    output = io.StringIO()
+    with pytest.raises(ScriptError) as info:
+        run_script(io.StringIO(SCRIPT), output, on_error="fail")
+    assert info.value.line_number == 5
+    # The results before the failing statement are written
+    assert output.getvalue() == "XV\nX\n"
+
+    output = io.StringIO()
+    assert run_script(io.StringIO(SCRIPT), output, on_error="skip").errors == 1
+    assert output.getvalue() == "XV\nX\nXXX\n"
+
+    with pytest.raises(ValueError):
+        run_script(io.StringIO(SCRIPT), output, on_error="ignore")
+    with pytest.raises(ValueError):
+        run_script(io.StringIO(SCRIPT), output, on_error="report")
+
+
+def test_main_script(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    script = tmp_path / "script.rdsl"
+    script.write_text(SCRIPT)
+    assert main([str(script)]) == 1
+    captured = capsys.readouterr()
+    assert captured.out == "XV\nX\nXXX\n"
+    assert "line 5" in captured.err
+
+    # Skipped failures are not reported but still set the exit status
+    assert main(["--on-error", "skip", str(script)]) == 1
+    assert capsys.readouterr().err == ""
+    assert main(["--on-error", "fail", str(script)]) == 1
+    assert capsys.readouterr().out == "XV\nX\n"
+    valid = tmp_path / "valid.rdsl"
+    valid.write_text("convert 12\n")
+    assert main(["--on-error", "skip", str(valid)]) == 0
+
+
+def test_main_stdin(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.setattr("sys.stdin", io.StringIO("convert 12\nconvert XII\n"))
+    assert main([]) == 0
+    assert capsys.readouterr().out == "XII\n12\n"
+
+
+def test_main_repl(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    lines = iter(["set a = X; add a V"])
+
+    def fake_input(prompt: str) -> str:
+        try:
+            return next(lines)
+        except StopIteration:
+            raise EOFError from None
+
+    monkeypatch.setattr("sys.stdin.isatty", lambda: True)
+    monkeypatch.setattr("builtins.input", fake_input)
+    assert main([]) == 0
+    assert "Result: XV" in capsys.readouterr().out
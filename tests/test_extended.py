@@ -0,0 +1,95 @@
+import pytest
+
+from roman_numerals_converter.extended import (
+    MAX_LENGTH,
+    OVERLINE,
+    from_extended_roman,
+    is_valid_extended_roman,
+    to_extended_roman,
+)
+from roman_numerals_converter.roman import RomanError
+from roman_numerals_converter.tables import INT_TO_ROMAN
+
+
+def overlined(roman: str, level: int = 1) -> str:
+    return "".join(letter + OVERLINE * level for letter in roman)
+
+
+@pytest.mark.parametrize(
+    "number, expected",
+    [
+        (1, "I"),
+        (3999, "MMMCMXCIX"),
+        (4000, overlined("IV")),
+        (4999, overlined("IV") + "CMXCIX"),
+        (10001, overlined("X") + "I"),
+        (1_000_000, overlined("M")),
+        (1_994_000, overlined("MCMXCIV")),
+        (3_999_999, overlined("MMMCMXCIX") + "CMXCIX"),
+        (4_000_000, overlined("IV", 2)),
+        (10**18, overlined("M", 5)),
+        (10**18 + 1994, overlined("M", 5) + overlined("I") + "CMXCIV"),
+        (2 * 10**9 + 5, overlined("MM", 2) + "V"),
+    ],
+)
+def test_round_trip(number: int, expected: str) -> None:
+    assert to_extended_roman(number) == expected
+    assert from_extended_roman(expected) == number
+
+
+def test_standard_range_unchanged() -> None:
+    for number in range(1, 4000):
+        assert to_extended_roman(number) == INT_TO_ROMAN[number]
+
+
+def test_round_trip_big_integers() -> None:
+    for exponent in range(4, 50, 5):
+        for number in (10**exponent - 1, 10**exponent, 7 * 10**exponent + 4321):
+            assert from_extended_roman(to_extended_roman(number)) == number
+
+
+@pytest.mark.parametrize("number", [0, -1, True, 1.5])
+def test_to_extended_roman_invalid(number: int) -> None:
+    with pytest.raises(RomanError):
+        to_extended_roman(number)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "",
+        "MMMM",
+        overlined("I"),  # 1000 is written M
+        overlined("IV") + "MMM",
+        overlined("IIII"),
+        "I" + overlined("X"),
+        overlined("I") + overlined("V", 2),
+        overlined("X") + "X" + overlined("X"),
+        OVERLINE + "I",
+        "I" + OVERLINE,
+        "x",
+    ],
+)
+def test_from_extended_roman_invalid(value: str) -> None:
+    assert not is_valid_extended_roman(value)
+    with pytest.raises(RomanError):
+        from_extended_roman(value)
+
+
+def test_max_length() -> None:
+    assert to_extended_roman(3888, max_length=1) == "MMMDCCCLXXXVIII"
+    assert to_extended_roman(4000, max_length=4) == overlined("IV")
+    with pytest.raises(RomanError, match="longer than 3 characters"):
+        to_extended_roman(4000, max_length=3)
+    # Huge numbers are rejected without being split into groups
+    with pytest.raises(RomanError, match=f"longer than {MAX_LENGTH} characters"):
+        to_extended_roman(10 ** (10**6))
+    with pytest.raises(RomanError):
+        from_extended_roman(overlined("IV"), max_length=3)
+    with pytest.raises(RomanError):
+        from_extended_roman("M" * (MAX_LENGTH + 1))
+
+
+def test_from_extended_roman_type() -> None:
+    with pytest.raises(RomanError):
+        from_extended_roman(4000)  # type: ignore
@@ -0,0 +1,61 @@
+import subprocess
+import sys
+
+import pytest
+
+import roman_numerals_converter
+
+
+def imported_modules(statement: str) -> set[str]:
+    """Run a statement in a fresh interpreter and list the modules it imported."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return {
+        line.rsplit("|", 1)[1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "|" in line
+    }
+
+
+def test_package_import_is_lightweight() -> None:
+    modules = imported_modules("import roman_numerals_converter")
+    assert "roman_numerals_converter.converter" in modules
+    for heavy in (
+        "click",
+        "numpy",
+        "multiprocessing",
+        "roman_numerals_converter.__main__",
+    ):
+        assert heavy not in modules
+
+
+def test_cli_import_skips_batch_dependencies() -> None:
+    modules = imported_modules("import roman_numerals_converter.__main__")
+    assert "click" in modules
+    assert "numpy" not in modules
+    assert "multiprocessing" not in modules
+    for module in ("daemon", "parallel"):
+        assert f"roman_numerals_converter.{module}" not in modules
+    assert "socketserver" not in modules
+
+
+def test_lazy_cli_attribute() -> None:
+    from roman_numerals_converter.__main__ import cli
+
+    assert roman_numerals_converter.cli is cli
+    with pytest.raises(AttributeError):
+        roman_numerals_converter.missing  # noqa: B018
+
+
+def test_module_entry_point() -> None:
+    result = subprocess.run(
+        [sys.executable, "-m", "roman_numerals_converter", "to-roman", "1994"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "MCMXCIV"
@@ -0,0 +1,51 @@
+import pytest
+
+from roman_numerals_converter import (
+    replace_integers_with_roman_numerals,
+    replace_roman_numerals_with_integers_in_text,
+)
+from roman_numerals_converter.parallel import (
+    convert_from_roman_parallel,
+    convert_line_blocks,
+    convert_to_roman_parallel,
+    parallel_map,
+    replace_integers_parallel,
+    replace_roman_numerals_parallel,
+)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_convert_parallel_preserves_order(workers: int) -> None:
+    numbers = list(range(3999, 0, -1))
+    romans = convert_to_roman_parallel(numbers, workers=workers, chunk_size=100)
+    assert romans[0] == "MMMCMXCIX"
+    assert romans[-1] == "I"
+    assert convert_from_roman_parallel(romans, workers, chunk_size=100) == numbers
+
+
+def test_convert_parallel_invalid() -> None:
+    with pytest.raises(ValueError):
+        convert_to_roman_parallel([1, 2, 4000], workers=2, chunk_size=1)
+
+
+def test_parallel_map_default_workers() -> None:
+    assert list(parallel_map(abs, range(-50, 0))) == list(range(50, 0, -1))
+
+
+def test_convert_line_blocks() -> None:
+    blocks = [["1\n", "2\n"], ["abc\n"], ["4\n"]]
+    results = list(convert_line_blocks(blocks, "to-roman", "mark", workers=2))
+    assert results == [(["I", "II"], 0, 2), (["#INVALID"], 1, 1), (["IV"], 0, 1)]
+    with pytest.raises(ValueError, match="line 3"):
+        list(convert_line_blocks(blocks, "to-roman", "fail", workers=2))
+
+
+def test_replace_parallel() -> None:
+    text = "In MMXVIII, the event took place on VII of June 2020. " * 100
+    chunks = [text[i : i + 37] for i in range(0, len(text), 37)]
+    assert "".join(replace_roman_numerals_parallel(chunks, workers=2)) == (
+        replace_roman_numerals_with_integers_in_text(text)
+    )
+    assert "".join(replace_integers_parallel(chunks, workers=2)) == (
+        replace_integers_with_roman_numerals(text)
+    )
@@ -1,3 +1,6 @@
+import copy
+import pickle
+
 import pytest
 
 from roman_numerals_converter import RomanError, RomanNumeral
@@ -60,6 +63,25 @@ def test_decimal_to_roman() -> None:
         assert str(roman_numeral) == expected_output
 
 
+def test_lookup_tables_round_trip() -> None:
+    # Test that every value in the domain survives a round trip through the tables
+    for decimal in range(1, 4000):
+        roman_numeral = RomanNumeral.from_decimal(decimal)
+        assert RomanNumeral.is_valid_roman(str(roman_numeral))
+        assert RomanNumeral(str(roman_numeral)).to_decimal() == decimal
+
+
+def test_roman_numeral_interning() -> None:
+    # Test that equal values share one preallocated object
+    assert RomanNumeral.from_decimal(1994) is RomanNumeral.from_decimal(1994)
+    assert RomanNumeral("MCMXCIV") is RomanNumeral.from_decimal(1994)
+    assert RomanNumeral("X") + RomanNumeral("V") is RomanNumeral("XV")
+    roman = RomanNumeral("XLII")
+    assert copy.copy(roman) is roman
+    assert pickle.loads(pickle.dumps(roman)) is roman
+    assert not hasattr(roman, "__dict__")
+
+
 def test_invalid_roman_input() -> None:
     # Test invalid Roman numeral input
     invalid_inputs = ["IIII", "VV", "LL", "DD", "MMMM", "ABC"]
@@ -114,6 +136,25 @@ def test_roman_numeral_equality():
     assert roman1 >= 10
 
 
+def test_roman_numeral_hash_and_int():
+    # Test hashing and integer conversion of RomanNumeral objects
+    roman = RomanNumeral("X")
+    assert hash(roman) == hash(10)
+    assert {roman: "ten"}[10] == "ten"
+    assert len({RomanNumeral("X"), RomanNumeral.from_decimal(10)}) == 1
+    assert int(roman) == 10
+    assert ["zero", "one", "two", "three", "four", "five"][RomanNumeral("V")] == "five"
+    numerals = [RomanNumeral.from_decimal(n) for n in (42, 7, 1994, 3)]
+    assert sorted(numerals) == [3, 7, 42, 1994]
+    with pytest.raises(RomanError):
+        assert roman < "ABC"  # type: ignore
+
+    # Equality with str is not hash-consistent, only int keys are interchangeable
+    assert roman == "X"
+    assert "X" not in {roman}
+    assert roman not in {"X"}
+
+
 def test_roman_numeral_addition():
     # Test addition of RomanNumeral objects
     roman1 = RomanNumeral("X")
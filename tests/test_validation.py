@@ -0,0 +1,34 @@
+import pytest
+
+from roman_numerals_converter import ROMAN_REGEX, is_valid_roman
+from roman_numerals_converter.validation import (
+    ROMAN_PATTERN,
+    VALID_ROMAN_NUMERALS,
+    matches_roman_pattern,
+)
+
+
+def test_valid_roman_numerals_set() -> None:
+    # Test that the set holds exactly the spellings accepted by the pattern
+    assert len(VALID_ROMAN_NUMERALS) == 3999
+    assert ROMAN_PATTERN.pattern == ROMAN_REGEX
+    for roman in VALID_ROMAN_NUMERALS:
+        assert matches_roman_pattern(roman)
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["I", "IV", "IX", "XII", "L", "MCMXCIV", "MMMCMXCIX"],
+)
+def test_is_valid_roman(value: str) -> None:
+    assert is_valid_roman(value)
+    assert matches_roman_pattern(value)
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["", "IIII", "VV", "LL", "DD", "MMMM", "ABC", "x", "X\n", " X"],
+)
+def test_is_invalid_roman(value: str) -> None:
+    assert not is_valid_roman(value)
+    assert not matches_roman_pattern(value)